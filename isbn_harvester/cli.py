@@ -5,6 +5,7 @@ import argparse
 import json
 import logging
 import os
+from operator import attrgetter
 from typing import List, Optional
 
 from isbn_harvester.enrich.taxonomy_assign import apply_taxonomy
@@ -13,11 +14,13 @@ from isbn_harvester.enrich.verify import verify_rows
 from isbn_harvester.integrations.covers import CoverUploader
 from isbn_harvester.integrations.http_client import TokenBucket, make_isbndb_session
 from isbn_harvester.integrations.profiler import RequestProfiler
+from isbn_harvester.core.checkpoint import read_completed
 from isbn_harvester.core.harvest import harvest
+from isbn_harvester.core.models import BookRow
 from isbn_harvester.core.store import RowStore
 from isbn_harvester.core.tasks import build_tasks
 from isbn_harvester.io.dashboard import write_dashboard
-from isbn_harvester.io.export_full import read_full_csv, write_full_csv
+from isbn_harvester.io.export_full import iter_full_csv, write_full_csv
 from isbn_harvester.io.export_shopify import write_shopify_products_csv
 from isbn_harvester.io.report import write_report
 from isbn_harvester.io.utils import atomic_write_text
@@ -31,19 +34,18 @@ LOG_LEVELS = {
     "error": logging.ERROR,
 }
 
-try:
-    from rich.logging import RichHandler
-except Exception:
-    RichHandler = None
-
 
 def _split_langs(s: str) -> Optional[List[str]]:
     parts = [x.strip() for x in (s or "").split(",") if x.strip()]
     return parts or None
 
 
-def main(argv: Optional[List[str]] = None) -> None:
-    logger = logging.getLogger(__name__)
+def _sort_by_rank(rows: List[BookRow]) -> List[BookRow]:
+    rows.sort(key=attrgetter("rank_score"), reverse=True)
+    return rows
+
+
+def _build_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser(
         prog="isbn_harvester",
         description="ISBNdb Jewish/Israel/Holocaust Book Harvester + Cover Uploader + Shopify CSV (metafields)",
@@ -66,6 +68,7 @@ def main(argv: Optional[List[str]] = None) -> None:
     ap.add_argument("--taxonomy-no-debug", action="store_true", help="Skip taxonomy debug/review outputs")
     ap.add_argument("--taxonomy-snapshot-every", type=int, default=0, help="Write taxonomy snapshots every N seconds")
     ap.add_argument("--taxonomy-snapshot-dir", default=None, help="Directory for taxonomy snapshots")
+    ap.add_argument("--taxonomy-workers", type=int, default=0, help="Processes for taxonomy tagging (0 = one per CPU)")
     ap.add_argument("--external-enrich", action="store_true", help="Enrich with OpenLibrary/Google Books/LOC before taxonomy")
     ap.add_argument("--external-enrich-all", action="store_true", help="Enrich all rows (not just sparse rows)")
     ap.add_argument("--external-enrich-max", type=int, default=0, help="Max rows to enrich (0 = all)")
@@ -130,6 +133,7 @@ def main(argv: Optional[List[str]] = None) -> None:
     ap.add_argument("--covers-timeout", type=int, default=40, help="Timeout for cover detail/image fetch")
     ap.add_argument("--covers-retries", type=int, default=6, help="Retries for cover detail/image fetch")
     ap.add_argument("--covers-concurrency", type=int, default=6, help="Parallel cover workers")
+    ap.add_argument("--covers-meta-concurrency", type=int, default=2, help="Parallel cover detail lookups (for rows without a cover URL)")
     ap.add_argument("--covers-rate-per-sec", type=float, default=3.0, help="Rate limit for cover detail calls")
     ap.add_argument("--covers-burst", type=int, default=6, help="Burst for cover detail calls")
     ap.add_argument("--covers-skip-existing-s3", action="store_true", help="Reuse any existing S3 object under covers/{isbn13}/")
@@ -137,6 +141,12 @@ def main(argv: Optional[List[str]] = None) -> None:
     ap.add_argument("--covers-max-seconds", type=int, default=0, help="Max runtime seconds for covers (0 = no limit)")
     ap.add_argument("--log-level", default="info", help="Log level: debug, info, warning, error")
 
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logger = logging.getLogger(__name__)
+    ap = _build_parser()
     args = ap.parse_args(argv)
 
     if args.safe_defaults:
@@ -144,6 +154,7 @@ def main(argv: Optional[List[str]] = None) -> None:
         args.rate_per_sec = min(args.rate_per_sec, 1.0)
         args.burst = min(args.burst, 2)
         args.covers_concurrency = min(args.covers_concurrency, 2)
+        args.covers_meta_concurrency = min(args.covers_meta_concurrency, 1)
         args.covers_rate_per_sec = min(args.covers_rate_per_sec, 1.0)
         args.covers_burst = min(args.covers_burst, 2)
         args.external_enrich_concurrency = min(args.external_enrich_concurrency, 2)
@@ -151,6 +162,11 @@ def main(argv: Optional[List[str]] = None) -> None:
         args.external_enrich_burst = min(args.external_enrich_burst, 2)
 
     level = LOG_LEVELS.get(args.log_level.lower(), logging.INFO)
+    # rich is imported lazily: it pulls in a lot of modules and only matters once logging is set up.
+    try:
+        from rich.logging import RichHandler
+    except Exception:
+        RichHandler = None
     if RichHandler:
         logging.basicConfig(
             level=level,
@@ -240,6 +256,12 @@ def main(argv: Optional[List[str]] = None) -> None:
     rows_by_isbn13 = {}
     profiler = RequestProfiler() if args.profile else None
 
+    # One checkpoint scan serves both harvest resume and the covers pass
+    # (harvest never writes cover records, so the cover set stays valid).
+    completed_tasks, done_covers = None, None
+    if args.checkpoint and (args.resume or args.covers or args.covers_only):
+        completed_tasks, done_covers = read_completed(args.checkpoint)
+
     if not args.covers_only:
         rows_by_isbn13 = harvest(
             tasks=tasks,
@@ -271,13 +293,13 @@ def main(argv: Optional[List[str]] = None) -> None:
             profiler=profiler,
             verbose_task_errors=True,
             search_mode=args.search_mode,
+            completed_tasks=completed_tasks,
         )
 
     # Convert to RowStore (covers.py expects RowStore)
     if args.covers_only:
         read_path = args.full_in or args.out
-        rows = read_full_csv(read_path)
-        rows_by_isbn13 = {r.isbn13: r for r in rows if r.isbn13}
+        rows_by_isbn13 = {r.isbn13: r for r in iter_full_csv(read_path) if r.isbn13}
     store = RowStore(rows_by_isbn13)
 
     if args.external_enrich:
@@ -336,16 +358,17 @@ def main(argv: Optional[List[str]] = None) -> None:
             debug_path=debug_path,
             snapshot_every_s=args.taxonomy_snapshot_every,
             snapshot_dir=args.taxonomy_snapshot_dir,
+            workers=args.taxonomy_workers,
         )
         store = RowStore({r.isbn13: r for r in tax_rows})
 
+    # Sorted once; the covers pass only touches cover fields, so rank order holds.
+    rows = _sort_by_rank(store.snapshot_values())
+
     # -----------------------
     # Write outputs (pre-covers)
     # -----------------------
     if not args.covers_only:
-        rows = store.snapshot_values()
-        rows.sort(key=lambda r: r.rank_score, reverse=True)
-
         write_full_csv(rows, args.out)
         logger.info("Done: wrote %s full rows -> %s", len(rows), args.out)
 
@@ -419,6 +442,7 @@ def main(argv: Optional[List[str]] = None) -> None:
             timeout_s=args.covers_timeout,
             retries=args.covers_retries,
             cover_concurrency=args.covers_concurrency,
+            meta_concurrency=args.covers_meta_concurrency,
             rate_limiter=cover_limiter,
             s3_bucket=s3_bucket,
             aws_region=aws_region,
@@ -426,13 +450,15 @@ def main(argv: Optional[List[str]] = None) -> None:
             checkpoint_path=args.checkpoint,
             stop_file=args.stop_file,
             max_seconds=args.covers_max_seconds,
+            done_covers=done_covers,
         )
 
         uploaded = uploader.run()
 
         # Rewrite outputs so CSVs include cover fields/CloudFront URL
-        rows = store.snapshot_values()
-        rows.sort(key=lambda r: r.rank_score, reverse=True)
+        if uploaded:
+            current = store.snapshot_dict()
+            rows = [current.get(r.isbn13, r) for r in rows]
 
         write_full_csv(rows, args.out)
         logger.info("Done: rewrote %s full rows with cover fields -> %s", len(rows), args.out)
@@ -477,8 +503,8 @@ def main(argv: Optional[List[str]] = None) -> None:
         logger.info("Done: wrote profile -> %s", args.profile)
 
     # Helpful warning: missing images
-    rows_final = store.snapshot_values()
-    missing_covers = [r for r in rows_final if not (r.cloudfront_cover_url or r.cover_url_original or r.cover_url)]
+    # `rows` already reflects the store (refreshed after covers), so no second snapshot.
+    missing_covers = [r for r in rows if not (r.cloudfront_cover_url or r.cover_url_original or r.cover_url)]
     if missing_covers:
         logger.warning("%s rows missing an image URL.", len(missing_covers))
         for r in missing_covers[:10]:
@@ -1,45 +1,64 @@
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 
-def _strip_inline_comment(val: str) -> str:
-    in_single = False
-    in_double = False
-    for i, ch in enumerate(val):
-        if ch == "'" and not in_double:
-            in_single = not in_single
-            continue
-        if ch == '"' and not in_single:
-            in_double = not in_double
-            continue
-        if ch == "#" and not in_single and not in_double:
-            return val[:i].rstrip()
-    return val.rstrip()
+# One KEY=value assignment per line, optionally prefixed with "export ". The value is
+# the longest run of quoted spans (an unterminated quote runs to end of line) and
+# non-comment characters; whatever follows is an inline "# comment". Comment lines,
+# blank lines and lines without "=" never match.
+_ENV_LINE = re.compile(
+    r"""^[ \t]*(?:export [ \t]*|(?!export )(?=[^\s#]))(?P<k>[^\s=][^=\n]*?)[ \t]*="""
+    r"""[ \t]*(?P<v>(?:'[^'\n]*'?|"[^"\n]*"?|[^'"#\n])*)""",
+    re.M,
+)
 
 
 def _parse_env_file(path: Path) -> None:
     try:
-        for line in path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            if line.startswith("export "):
-                line = line[len("export ") :].lstrip()
-            k, v = line.split("=", 1)
-            k = k.strip()
-            v = _strip_inline_comment(v.strip())
+        for m in _ENV_LINE.finditer(path.read_text(encoding="utf-8")):
+            k, v = m["k"], m["v"].rstrip()
             if len(v) >= 2 and v[0] == v[-1] and v[0] in ("'", '"'):
                 v = v[1:-1]
-            if k and k not in os.environ:
+            if k not in os.environ:
                 os.environ[k] = v
     except Exception:
         return
 
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=8)
+def _find_dotenv(override: str, path_str: str, cwd_str: str, project_root_str: str) -> Optional[str]:
+    candidates: List[Path] = []
+    if override:
+        candidates.append(Path(override).expanduser())
+
+    p = Path(path_str).expanduser()
+    candidates.append(p if p.is_absolute() else (Path(cwd_str) / p))
+    candidates.append(Path(project_root_str) / ".env")
+    candidates.append(Path(cwd_str) / ".env")
+
+    seen = set()
+    for c in candidates:
+        key = str(c)
+        if key in seen:
+            continue
+        seen.add(key)
+        if c.is_file():
+            try:
+                return str(c.resolve())
+            except Exception:
+                return key
+    return None
+
+
 def load_dotenv(path: str = ".env") -> Optional[str]:
     """
     Loads environment variables from a .env file.
@@ -51,38 +70,12 @@ def load_dotenv(path: str = ".env") -> Optional[str]:
     4) current working directory
 
     Returns the resolved .env path used, or None if not found.
+    The search result is cached per (ENV_PATH, path, CWD).
     """
-    # 1) explicit override
-    override = os.getenv("ENV_PATH")
-    candidates: List[Path] = []
-    if override:
-        candidates.append(Path(override).expanduser())
-
-    p = Path(path).expanduser()
-    candidates.append(p if p.is_absolute() else (Path.cwd() / p))
-
-    # 3) project root = parent of this file's package dir
-    pkg_dir = Path(__file__).resolve().parent
-    project_root = pkg_dir.parent
-    candidates.append(project_root / ".env")
-
-    # 4) CWD fallback
-    candidates.append(Path.cwd() / ".env")
-
-    seen = set()
-    for c in candidates:
-        try:
-            c = c.resolve()
-        except Exception:
-            pass
-        if str(c) in seen:
-            continue
-        seen.add(str(c))
-        if c.exists() and c.is_file():
-            _parse_env_file(c)
-            return str(c)
-
-    return None
+    found = _find_dotenv(os.getenv("ENV_PATH") or "", path, os.getcwd(), str(_PROJECT_ROOT))
+    if found:
+        _parse_env_file(Path(found))
+    return found
 
 
 @dataclass
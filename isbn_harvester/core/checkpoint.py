@@ -1,77 +1,190 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 import threading
-from typing import Optional, Set
+import time
+from typing import Iterable, List, Optional, Set, Tuple
+
+import orjson
+import xxhash
 
 from isbn_harvester.core.models import TaskSpec
 
+# v1: no header record, task ids are SHA-1 hex digests.
+# v2: first record is {"type": "checkpoint_header", "v": 2}, task ids are xxh3_64 hex digests.
+CHECKPOINT_VERSION = 2
+
+# cover_uploaded / cover_reused_existing_s3 are only written by older runs (now folded into
+# cover_done with a mode and s3_key) but still count when resuming from their checkpoints.
+_COVER_DONE_TYPES = frozenset({"cover_done", "cover_uploaded", "cover_reused_existing_s3"})
+
+
+def _task_key(spec: TaskSpec) -> bytes:
+    return f"{spec.endpoint}|{spec.group}|{spec.query}".encode("utf-8")
+
+
+def _sha1_hexdigest(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
 
-def task_id(spec: TaskSpec) -> str:
-    return hashlib.sha1(f"{spec.endpoint}|{spec.group}|{spec.query}".encode("utf-8")).hexdigest()
+def task_id(spec: TaskSpec, version: int = CHECKPOINT_VERSION) -> str:
+    if version >= 2:
+        return xxhash.xxh3_64_hexdigest(_task_key(spec))
+    return _sha1_hexdigest(_task_key(spec))
 
 
-def read_completed_tasks(checkpoint_path: Optional[str]) -> Set[str]:
-    done: Set[str] = set()
-    if not checkpoint_path or not os.path.exists(checkpoint_path):
-        return done
+def task_ids(specs: Iterable[TaskSpec], version: int = CHECKPOINT_VERSION) -> List[str]:
+    """Batch form of task_id(): one hasher lookup for the whole task list."""
+    digest = xxhash.xxh3_64_hexdigest if version >= 2 else _sha1_hexdigest
+    return [digest(f"{s.endpoint}|{s.group}|{s.query}".encode("utf-8")) for s in specs]
+
+
+def checkpoint_version(checkpoint_path: Optional[str]) -> int:
+    """
+    Version of an existing checkpoint file.
+    Missing/empty files get the current version; files without a header are legacy v1.
+    """
+    if not checkpoint_path:
+        return CHECKPOINT_VERSION
     try:
-        with open(checkpoint_path, "r", encoding="utf-8") as f:
+        with open(checkpoint_path, "rb") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    rec = json.loads(line)
+                    rec = orjson.loads(line)
                 except Exception:
-                    continue
-                if rec.get("type") == "task_done" and rec.get("task_id"):
-                    done.add(rec["task_id"])
+                    return 1
+                if isinstance(rec, dict) and rec.get("type") == "checkpoint_header":
+                    return int(rec.get("v") or 1)
+                return 1
     except Exception:
-        return done
-    return done
+        return CHECKPOINT_VERSION
+    return CHECKPOINT_VERSION
 
 
-def read_completed_covers(checkpoint_path: Optional[str]) -> Set[str]:
-    done: Set[str] = set()
-    if not checkpoint_path or not os.path.exists(checkpoint_path):
-        return done
+def read_completed(checkpoint_path: Optional[str]) -> Tuple[Set[int], Set[str]]:
+    """
+    Single pass over the checkpoint returning (completed task ids, completed cover isbn13s).
+    Task ids are parsed from hex into ints: smaller sets and cheaper membership tests
+    on large resumes. Compare against int(task_id(spec), 16).
+    """
+    tasks: Set[int] = set()
+    covers: Set[str] = set()
+    if not checkpoint_path:
+        return tasks, covers
     try:
-        with open(checkpoint_path, "r", encoding="utf-8") as f:
+        with open(checkpoint_path, "rb", buffering=1 << 20) as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    rec = json.loads(line)
+                    rec = orjson.loads(line)
                 except Exception:
                     continue
-                typ = rec.get("type")
-                if typ in ("cover_done", "cover_uploaded", "cover_reused_existing_s3") and rec.get("isbn13"):
-                    done.add(rec["isbn13"])
+                if not isinstance(rec, dict):
+                    continue
+                rec_get = rec.get
+                typ = rec_get("type")
+                if typ == "task_done":
+                    tid = rec_get("task_id")
+                    if tid:
+                        try:
+                            tasks.add(int(tid, 16))
+                        except (TypeError, ValueError):
+                            continue
+                elif typ in _COVER_DONE_TYPES:
+                    isbn13 = rec_get("isbn13")
+                    if isbn13:
+                        covers.add(isbn13)
     except Exception:
-        return done
-    return done
+        return tasks, covers
+    return tasks, covers
+
+
+def read_completed_tasks(checkpoint_path: Optional[str]) -> Set[int]:
+    return read_completed(checkpoint_path)[0]
+
+
+def read_completed_covers(checkpoint_path: Optional[str]) -> Set[str]:
+    return read_completed(checkpoint_path)[1]
 
 
 class CheckpointWriter:
+    """
+    Append-only NDJSON writer shared by worker threads.
+
+    Records are buffered in memory and flushed once the buffer passes FLUSH_BYTES,
+    once FLUSH_INTERVAL_S has elapsed, or by a background flusher thread; close()
+    drains whatever is left.
+    """
+
+    __slots__ = ("path", "version", "_lock", "_fh", "_buf", "_last_flush", "_stop", "_flusher")
+
+    FLUSH_BYTES = 64 * 1024
+    FLUSH_INTERVAL_S = 0.5
+
     def __init__(self, path: Optional[str]) -> None:
         self.path = path
         self._lock = threading.Lock()
-        if path:
-            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-        self._fh = open(path, "a", encoding="utf-8") if path else None
+        self.version = checkpoint_version(path)
+        d = os.path.dirname(path) if path else ""
+        if d:
+            os.makedirs(d, exist_ok=True)
+        self._fh = open(path, "ab") if path else None
+        self._buf = bytearray()
+        self._last_flush = time.monotonic()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if self._fh:
+            if self._fh.tell() == 0:
+                self.write({"type": "checkpoint_header", "v": self.version})
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+
+    def _flush_locked(self) -> None:
+        if self._buf:
+            self._fh.write(self._buf)
+            self._buf.clear()
+        self._fh.flush()
+        self._last_flush = time.monotonic()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.FLUSH_INTERVAL_S):
+            with self._lock:
+                if self._fh and self._buf:
+                    self._flush_locked()
 
     def write(self, obj: dict) -> None:
         if not self._fh:
             return
+        # Encode outside the lock; only the buffer append is serialized.
+        data = orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
         with self._lock:
-            self._fh.write(json.dumps(obj, ensure_ascii=False) + "\n")
-            self._fh.flush()
+            if not self._fh:
+                return
+            self._buf += data
+            if (
+                len(self._buf) >= self.FLUSH_BYTES
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_S
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._fh:
+                self._flush_locked()
 
     def close(self) -> None:
-        if self._fh:
-            self._fh.close()
-            self._fh = None
+        self._stop.set()
+        if self._flusher:
+            self._flusher.join(timeout=1.0)
+            self._flusher = None
+        with self._lock:
+            if self._fh:
+                self._flush_locked()
+                self._fh.close()
+                self._fh = None
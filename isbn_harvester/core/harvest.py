@@ -11,7 +11,7 @@ import time
 from queue import Empty, Queue
 from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from isbn_harvester.core.checkpoint import CheckpointWriter, read_completed_tasks, task_id
+from isbn_harvester.core.checkpoint import CheckpointWriter, read_completed_tasks, task_ids
 from isbn_harvester.core.models import BookRow, TaskSpec
 from isbn_harvester.core.normalize import build_shopify_tags
 from isbn_harvester.core.parse import parse_book
@@ -264,6 +264,7 @@ class Harvester:
         max_seconds: int,
         dry_run: bool = False,
         verbose_task_errors: bool = True,
+        completed_tasks: Optional[Set[int]] = None,
     ) -> None:
         self.tasks = tasks
         self.session = session
@@ -272,6 +273,7 @@ class Harvester:
         self.raw_jsonl = raw_jsonl
         self.checkpoint_path = checkpoint_path
         self.resume = resume
+        self.completed_tasks = completed_tasks
 
         self.max_per_task = max_per_task
         self.page_size = page_size
@@ -425,22 +427,24 @@ class Harvester:
                 continue
 
     def run(self) -> Dict[str, BookRow]:
-        completed = read_completed_tasks(self.checkpoint_path) if self.resume else set()
-
-        work: List[TaskSpec] = []
-        for t in self.tasks:
-            tid = task_id(t)
-            if tid in completed:
-                continue
-            work.append(t)
+        completed: Set[int] = set()
+        if self.resume:
+            if self.completed_tasks is not None:
+                completed = self.completed_tasks
+            else:
+                completed = read_completed_tasks(self.checkpoint_path)
+        ids = task_ids(self.tasks, self.ck.version)
+        work: List[Tuple[TaskSpec, str]] = [
+            (t, tid) for t, tid in zip(self.tasks, ids) if int(tid, 16) not in completed
+        ]
 
         if self.shuffle_tasks:
             random.shuffle(work)
 
         logger.info("Harvest start: tasks=%s concurrency=%s", len(work), self.concurrency)
-        q: Queue[TaskSpec] = Queue()
-        for t in work:
-            q.put(t)
+        q: Queue[Tuple[TaskSpec, str]] = Queue()
+        for item in work:
+            q.put(item)
 
         self.stats.set_tasks_total(len(work))
 
@@ -457,11 +461,10 @@ class Harvester:
                     return
 
                 try:
-                    t = q.get_nowait()
+                    t, tid = q.get_nowait()
                 except Empty:
                     return
 
-                tid = task_id(t)
                 page = 1
                 kept_local = 0
                 seen_local = 0
@@ -843,6 +846,7 @@ def harvest(
     max_seconds: int,
     dry_run: bool = False,
     verbose_task_errors: bool = True,
+    completed_tasks: Optional[Set[int]] = None,
 ) -> Dict[str, BookRow]:
     """
     Convenience wrapper for code that prefers a function call.
@@ -877,5 +881,6 @@ def harvest(
         max_seconds=max_seconds,
         dry_run=dry_run,
         verbose_task_errors=verbose_task_errors,
+        completed_tasks=completed_tasks,
     )
     return h.run()
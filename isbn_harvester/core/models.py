@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookRow:
     isbn10: str
     isbn13: str
@@ -67,14 +67,14 @@ class BookRow:
     page: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskSpec:
     endpoint: str  # "search" | "publisher" | "subject"
     query: str
     group: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatsSnapshot:
     tasks_total: int
     tasks_done: int
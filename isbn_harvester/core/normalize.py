@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import html
 import re
+from functools import lru_cache
+from operator import mul
 from typing import List, Set
 
 ISBN10_RE = re.compile(r"^\d{9}[\dX]$")
@@ -10,57 +12,81 @@ ISBN13_RE = re.compile(r"^\d{13}$")
 _TAG_SPLIT = re.compile(r"[;,/|]+")
 _TAG_CLEAN = re.compile(r"[^\w\s-]+")
 _SUBJECT_SPLIT = _TAG_SPLIT
+_ISBN_NONDIGIT = re.compile(r"[^0-9Xx]")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_ISBN10_WEIGHTS = tuple(range(1, 10))
 
 
 def normalize_isbn(x: str) -> str:
     x = (x or "").strip()
-    x = re.sub(r"[^0-9Xx]", "", x).upper()
+    x = _ISBN_NONDIGIT.sub("", x).upper()
     return x
 
 
-def is_valid_isbn10(isbn10: str) -> bool:
-    isbn10 = normalize_isbn(isbn10)
-    if not ISBN10_RE.match(isbn10):
+def _isbn13_check_digit(first12: str) -> int:
+    # Weights alternate 1,3: sum the even and odd positions separately instead of per digit.
+    s = sum(map(int, first12[0::2])) + 3 * sum(map(int, first12[1::2]))
+    return (10 - (s % 10)) % 10
+
+
+def _is_valid_isbn10_normalized(isbn10: str) -> bool:
+    if len(isbn10) != 10 or not isbn10[:9].isdigit():
         return False
-    total = 0
-    for i, ch in enumerate(isbn10[:9], start=1):
-        total += i * int(ch)
     check = isbn10[9]
-    check_val = 10 if check == "X" else int(check)
-    total += 10 * check_val
-    return total % 11 == 0
+    if check == "X":
+        check_val = 10
+    elif check.isdigit():
+        check_val = int(check)
+    else:
+        return False
+    total = sum(map(mul, _ISBN10_WEIGHTS, map(int, isbn10[:9])))
+    return (total + 10 * check_val) % 11 == 0
+
+
+def _is_ascii_digits(x: str) -> bool:
+    # Already-normalized input (the common case from the API): normalize_isbn would be a no-op.
+    return x.isascii() and x.isdigit()
+
+
+def is_valid_isbn10(isbn10: str) -> bool:
+    if not (isbn10 and _is_ascii_digits(isbn10)):
+        isbn10 = normalize_isbn(isbn10)
+    return _is_valid_isbn10_normalized(isbn10)
 
 
 def is_valid_isbn13(isbn13: str) -> bool:
-    isbn13 = normalize_isbn(isbn13)
-    if not ISBN13_RE.match(isbn13):
+    if not (isbn13 and _is_ascii_digits(isbn13)):
+        isbn13 = normalize_isbn(isbn13)
+    if len(isbn13) != 13 or not isbn13.isdigit():
         return False
-    digits = [int(c) for c in isbn13]
-    s = 0
-    for i in range(12):
-        s += digits[i] * (1 if i % 2 == 0 else 3)
-    check = (10 - (s % 10)) % 10
-    return check == digits[12]
+    return _isbn13_check_digit(isbn13[:12]) == int(isbn13[12])
 
 
 def isbn10_to_isbn13(isbn10: str) -> str:
     isbn10 = normalize_isbn(isbn10)
-    if not is_valid_isbn10(isbn10):
+    if not _is_valid_isbn10_normalized(isbn10):
         return ""
     core = "978" + isbn10[:9]
-    digits = [int(c) for c in core]
-    s = 0
-    for i in range(12):
-        s += digits[i] * (1 if i % 2 == 0 else 3)
-    check = (10 - (s % 10)) % 10
-    return f"{core}{check}"
+    return f"{core}{_isbn13_check_digit(core)}"
 
 
 def snip_html(text: str, max_len: int = 260) -> str:
     if not text:
         return ""
-    t = re.sub(r"<[^>]+>", " ", str(text))
-    t = re.sub(r"\s+", " ", t).strip()
+    s = str(text)
+    window = max(1024, 4 * max_len)
+    if len(s) > window:
+        # Long synopses: clean only a prefix first. Every "<" before the window's last ">"
+        # closes inside the window, so cutting at the first "<" after that ">" keeps tag
+        # stripping identical to the full text, and a long enough cleaned prefix is also
+        # a prefix of the full result.
+        cut = s.find("<", s.rfind(">", 0, window) + 1, window)
+        if cut < 0:
+            cut = window
+        head = " ".join(_HTML_TAG.sub(" ", s[:cut]).split())
+        if len(head) > max_len:
+            return head[:max_len] + "…"
+    t = " ".join(_HTML_TAG.sub(" ", s).split())
     return t[:max_len] + ("…" if len(t) > max_len else "")
 
 
@@ -69,11 +95,10 @@ def html_escape_text(s: str) -> str:
 
 
 def _norm_tag(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = re.sub(r"[-–—]", "-", s)
+    s = (s or "").strip().lower().replace("–", "-").replace("—", "-")
     s = _TAG_CLEAN.sub("", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    # " ".join(split()) collapses and trims whitespace in one C-level pass.
+    return " ".join(s.split())
 
 
 def _smart_title(s: str) -> str:
@@ -86,12 +111,13 @@ def _smart_title(s: str) -> str:
     return s.title()
 
 
+# Subject vocabularies are small and repeat across rows, so most calls are cache hits.
+@lru_cache(maxsize=16384)
 def normalize_subject_term(s: str) -> str:
     s = (s or "").strip()
     if not s:
         return ""
-    s = s.replace("_", " ")
-    s = re.sub(r"\s+", " ", s).strip()
+    s = " ".join(s.replace("_", " ").split())
     return _smart_title(s)
 
 
@@ -131,6 +157,7 @@ def build_shopify_tags(
 
     seen: Set[str] = set()
     out: List[str] = []
+    total_len = 0  # len(", ".join(out)), tracked instead of re-joining per tag
     for r in raw:
         t = _norm_tag(r)
         if not t or len(t) < 2:
@@ -142,11 +169,12 @@ def build_shopify_tags(
         if len(t) > 255:
             t = t[:255].strip()
 
-        candidate = (", ".join(out + [t])) if out else t
-        if len(candidate) > max_total_len:
+        add_len = len(t) + (2 if out else 0)
+        if total_len + add_len > max_total_len:
             break
 
         out.append(t)
+        total_len += add_len
         if len(out) >= max_tags:
             break
 
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import math
 import re
+import time
 from datetime import datetime
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Set, Tuple
 
-SCORE_TERMS = {
+SCORE_TERMS: Mapping[str, int] = MappingProxyType({
     "jewish": 6, "judaism": 6, "jews": 5, "hebrew": 4, "yiddish": 4,
     "talmud": 4, "torah": 4, "rabbi": 3, "synagogue": 3, "hasidic": 3,
     "hasidism": 3, "kosher": 2, "kabbalah": 3, "sephardic": 3, "ashkenazi": 3,
@@ -23,16 +26,16 @@ SCORE_TERMS = {
     "midrash": 3, "halacha": 3, "tikkun": 2, "gemara": 3, "siddur": 3,
 
     "yad vashem": 4, "balfour": 2, "knesset": 2, "idf": 2,
-}
+})
 
-NEGATIVE_TERMS = {
+NEGATIVE_TERMS: Mapping[str, int] = MappingProxyType({
     "christmas": -2,
     "easter": -2,
     "church": -2,
     "bible study": -1,
     "new testament": -2,
     "jesus": -3,
-}
+})
 
 FICTION_HINTS = (
     "fiction", "novel", "short stories", "mystery", "thriller",
@@ -41,46 +44,61 @@ FICTION_HINTS = (
 NON_FICTION_HINTS = ("nonfiction", "non-fiction")
 
 _WORDISH = re.compile(r"^[a-z0-9]+$")
+_DASHES = re.compile(r"[-–—]")
+_WHITESPACE = re.compile(r"\s+")
+_NONDIGITS = re.compile(r"\D+")
+_LEADING_YEAR = re.compile(r"^(\d{4})")
 
 
-_SYNONYM_REPLACEMENTS = {
+_SYNONYM_REPLACEMENTS: Mapping[str, str] = MappingProxyType({
     "anti-semitism": "antisemitism",
     "anti semitism": "antisemitism",
     "antisemitism": "antisemitism",
     "chassidic": "hasidic",
     "chasidic": "hasidic",
     "shabbos": "shabbat",
-}
+})
 
-_SYNONYM_PATTERNS = [
-    (re.compile(rf"\\b{re.escape(src)}\\b"), dst) for src, dst in _SYNONYM_REPLACEMENTS.items()
-]
+# One alternation for all synonyms: a single scan of the haystack instead of one per entry.
+_SYNONYM_RE = re.compile(
+    r"\b(" + "|".join(re.escape(src) for src in _SYNONYM_REPLACEMENTS) + r")\b"
+)
+
+
+def _synonym_for(m: re.Match) -> str:
+    return _SYNONYM_REPLACEMENTS[m.group(1)]
 
 
 def _apply_synonyms(hay: str) -> str:
-    for pattern, dst in _SYNONYM_PATTERNS:
-        hay = pattern.sub(dst, hay)
-    return hay
+    return _SYNONYM_RE.sub(_synonym_for, hay)
 
 
-def _normalize_haystack(*texts: str) -> str:
+@lru_cache(maxsize=8192)
+def _normalize_haystack_cached(texts: Tuple[str, ...]) -> str:
     hay = " ".join([t or "" for t in texts])
     hay = hay.lower()
     hay = _apply_synonyms(hay)
-    hay = re.sub(r"[-–—]", " ", hay)
-    hay = re.sub(r"\s+", " ", hay).strip()
+    hay = _DASHES.sub(" ", hay)
+    hay = _WHITESPACE.sub(" ", hay).strip()
     return hay
 
 
-def _term_in_hay(term: str, hay: str) -> bool:
-    t = (term or "").strip().lower()
-    if not t:
-        return False
-    if " " in t:
-        return t in hay
-    if _WORDISH.match(t):
-        return re.search(rf"\b{re.escape(t)}\b", hay) is not None
-    return t in hay
+def _normalize_haystack(*texts: str) -> str:
+    # Rows are re-scored on merge/update with the same fields; memoize on the raw inputs.
+    return _normalize_haystack_cached(texts)
+
+
+# Term matching rule (scores and fiction hints): terms made only of [a-z0-9] match on word
+# boundaries; anything else (phrases, hyphenated) is a plain substring test of the haystack.
+# Scoring terms in dict order as (term, weight, is_word); word terms go through _SCORE_WORD_RE.
+_SCORE_ENTRIES: Tuple[Tuple[str, float, bool], ...] = tuple(
+    (t, w, bool(_WORDISH.match(t))) for t, w in (*SCORE_TERMS.items(), *NEGATIVE_TERMS.items())
+)
+# Every alternative spans a whole word, so group(0) is always the matched word. The
+# trailing jew\w* alternative folds in the "contains:jew*" probe.
+_SCORE_WORD_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(t) for t, _, is_word in _SCORE_ENTRIES if is_word) + r"|jew\w*)\b"
+)
 
 
 def jewish_relevance_score(*texts: str, field_weights: Optional[List[float]] = None) -> Tuple[int, List[str]]:
@@ -91,30 +109,54 @@ def jewish_relevance_score(*texts: str, field_weights: Optional[List[float]] = N
         weights = [1.0] * len(texts)
 
     score = 0.0
-    matched: List[str] = []
+    # A set: terms repeat across fields, and the result is returned sorted anyway.
+    matched: Set[str] = set()
 
     for text, wgt in zip(texts, weights):
         hay = _normalize_haystack(text)
-        for term, w in SCORE_TERMS.items():
-            if _term_in_hay(term, hay):
-                score += w * float(wgt)
-                matched.append(term)
-        for term, w in NEGATIVE_TERMS.items():
-            if _term_in_hay(term, hay):
-                score += w * float(wgt)
-                matched.append(term)
-        if re.search(r"\bjew\w*\b", hay):
-            score += 2 * float(wgt)
-            matched.append("contains:jew*")
+        if not hay:
+            continue
+        words = {m.group(0) for m in _SCORE_WORD_RE.finditer(hay)}
+        wgt = float(wgt)
+        for term, w, is_word in _SCORE_ENTRIES:
+            if (term in words) if is_word else (term in hay):
+                score += w * wgt
+                matched.add(term)
+        if any(word.startswith("jew") for word in words):
+            score += 2 * wgt
+            matched.add("contains:jew*")
+
+    return int(round(score)), sorted(matched)
+
+
+def _hint_alternation(hints: Tuple[str, ...]) -> re.Pattern:
+    parts = []
+    for h in hints:
+        h = h.strip().lower()
+        parts.append(rf"\b{re.escape(h)}\b" if _WORDISH.match(h) else re.escape(h))
+    return re.compile("|".join(parts))
+
 
-    return int(round(score)), sorted(set(matched))
+_NON_FICTION_RE = _hint_alternation(NON_FICTION_HINTS)
+_FICTION_RE = _hint_alternation(FICTION_HINTS)
 
 
 def fiction_flag(subjects: str, synopsis: str, title: str = "") -> int:
     hay = _normalize_haystack(subjects, synopsis, title)
-    if any(_term_in_hay(h, hay) for h in NON_FICTION_HINTS):
+    if _NON_FICTION_RE.search(hay):
         return 0
-    return 1 if any(_term_in_hay(h, hay) for h in FICTION_HINTS) else 0
+    return 1 if _FICTION_RE.search(hay) else 0
+
+
+@lru_cache(maxsize=1)
+def _year_for_minute(minute: int) -> int:
+    return datetime.now().year
+
+
+def _current_year() -> int:
+    # popularity_proxy runs once per book; a new minute key is the only thing that
+    # makes the cache call datetime.now() again.
+    return _year_for_minute(int(time.time() // 60))
 
 
 def popularity_proxy(
@@ -126,22 +168,19 @@ def popularity_proxy(
     ratings_count: int | None = None,
 ) -> float:
     p = 0.0
-    try:
-        n = int(re.sub(r"\D+", "", pages or "") or "0")
-        p += min(1.0, n / 600.0) * 0.35
-    except Exception:
-        pass
+    if pages:
+        digits = _NONDIGITS.sub("", pages)
+        if digits:
+            p += min(1.0, int(digits) / 600.0) * 0.35
 
     year = None
-    try:
-        m = re.match(r"^(\d{4})", (date_published or "").strip())
+    if date_published:
+        m = _LEADING_YEAR.match(date_published.strip())
         if m:
             year = int(m.group(1))
-    except Exception:
-        year = None
 
     if year:
-        age = max(0, datetime.now().year - year)
+        age = max(0, _current_year() - year)
         p += max(0.0, 1.0 - min(30.0, age) / 30.0) * 0.35
     else:
         p += 0.10
@@ -1,31 +1,57 @@
 from __future__ import annotations
 
 import threading
+import time
 from dataclasses import replace
-from typing import Optional
+from typing import List, Optional
 
 from isbn_harvester.core.models import StatsSnapshot
 
 
+class _ThreadCounts:
+    """Per-thread counters; only the owning thread ever writes to one."""
+
+    __slots__ = ("requests_made", "errors", "books_seen", "kept", "tasks_done")
+
+    def __init__(self) -> None:
+        self.requests_made = 0
+        self.errors = 0
+        self.books_seen = 0
+        self.kept = 0
+        self.tasks_done = 0
+
+
 class StatsTracker:
     """
     Thread-safe stats collector for harvest progress.
 
-    Rule: All mutation is done under one lock.
-    Call snapshot(...) to get a consistent StatsSnapshot for printing/logging.
+    Rule: hot-path counters (inc_*) are sharded per thread and need no lock; each
+    thread only mutates its own shard. Shard registration, the set_* fields and
+    snapshots take the lock. reset() never writes to a shard (an owner's unlocked +=
+    could resurrect the old value); it records the current totals as a baseline that
+    snapshots subtract. Call snapshot(...) to get a StatsSnapshot for
+    printing/logging.
     """
 
     def __init__(self, tasks_total: int = 0) -> None:
         self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: List[_ThreadCounts] = []
+        self._baseline = _ThreadCounts()
         self._tasks_total = int(tasks_total)
-        self._tasks_done = 0
-        self._requests_made = 0
-        self._errors = 0
-        self._books_seen = 0
-        self._kept = 0
         self._unique13 = 0
         self._start_ts = None
 
+    def _counts(self) -> _ThreadCounts:
+        try:
+            return self._local.counts
+        except AttributeError:
+            counts = _ThreadCounts()
+            with self._lock:
+                self._shards.append(counts)
+            self._local.counts = counts
+            return counts
+
     def set_tasks_total(self, n: int) -> None:
         with self._lock:
             self._tasks_total = int(n)
@@ -35,50 +61,54 @@ class StatsTracker:
             self._unique13 = int(n)
 
     def inc_requests(self, n: int = 1) -> None:
-        with self._lock:
-            self._requests_made += int(n)
+        self._counts().requests_made += int(n)
 
     def inc_errors(self, n: int = 1) -> None:
-        with self._lock:
-            self._errors += int(n)
+        self._counts().errors += int(n)
 
     def inc_books_seen(self, n: int = 1) -> None:
-        with self._lock:
-            self._books_seen += int(n)
+        self._counts().books_seen += int(n)
 
     def inc_kept(self, n: int = 1) -> None:
-        with self._lock:
-            self._kept += int(n)
+        self._counts().kept += int(n)
 
     def inc_tasks_done(self, n: int = 1) -> None:
-        with self._lock:
-            self._tasks_done += int(n)
+        self._counts().tasks_done += int(n)
 
     def reset(self, *, tasks_total: Optional[int] = None) -> None:
         with self._lock:
             if tasks_total is not None:
                 self._tasks_total = int(tasks_total)
-            self._tasks_done = 0
-            self._requests_made = 0
-            self._errors = 0
-            self._books_seen = 0
-            self._kept = 0
+            self._baseline = self._totals()
             self._unique13 = 0
             self._start_ts = None
 
+    def _totals(self) -> _ThreadCounts:
+        # Caller holds the lock (it guards the shard list, not the counters).
+        out = _ThreadCounts()
+        for c in self._shards:
+            out.requests_made += c.requests_made
+            out.errors += c.errors
+            out.books_seen += c.books_seen
+            out.kept += c.kept
+            out.tasks_done += c.tasks_done
+        return out
+
     def snapshot(self, *, unique13: Optional[int] = None) -> StatsSnapshot:
         with self._lock:
             if unique13 is not None:
                 self._unique13 = int(unique13)
             if self._start_ts is None:
-                self._start_ts = __import__("time").time()
+                self._start_ts = time.time()
+            totals = self._totals()
+            base = self._baseline
             return StatsSnapshot(
                 tasks_total=self._tasks_total,
-                tasks_done=self._tasks_done,
-                requests_made=self._requests_made,
-                errors=self._errors,
-                books_seen=self._books_seen,
-                kept=self._kept,
+                tasks_done=totals.tasks_done - base.tasks_done,
+                requests_made=totals.requests_made - base.requests_made,
+                errors=totals.errors - base.errors,
+                books_seen=totals.books_seen - base.books_seen,
+                kept=totals.kept - base.kept,
                 unique13=self._unique13,
             )
 
@@ -100,7 +130,7 @@ class StatsTracker:
             start_ts = self._start_ts
         if start_ts is None:
             return {"seconds": 0.0, "requests_per_sec": 0.0, "books_per_sec": 0.0}
-        elapsed = max(0.0001, __import__("time").time() - start_ts)
+        elapsed = max(0.0001, time.time() - start_ts)
         return {
             "seconds": elapsed,
             "requests_per_sec": snap.requests_made / elapsed,
@@ -1,40 +1,79 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import threading
-from typing import Callable, Dict, List, Optional
+import zlib
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
 
 from isbn_harvester.core.models import BookRow
 
+_SHARDS = 16
+
+
+def _shard_index(isbn13: str) -> int:
+    # crc32 spreads ISBNs over every shard and, unlike hash(), is stable across processes.
+    return zlib.crc32(isbn13.encode()) % _SHARDS
+
+
+_Shard = Tuple[threading.Lock, Dict[str, BookRow], Dict[str, int]]
+
 
 class RowStore:
     """
     Thread-safe store for immutable BookRow objects.
     All updates are atomic read/modify/write operations.
+
+    Rows are split across _SHARDS dicts, each with its own lock, so workers touching
+    different ISBNs don't contend. Every ISBN also gets a store-wide sequence number on
+    first insert, and snapshots merge the shards on it, so they keep insertion order
+    exactly as a single dict would.
     """
 
     def __init__(self, initial: Optional[Dict[str, BookRow]] = None) -> None:
-        self._lock = threading.Lock()
-        self._rows: Dict[str, BookRow] = dict(initial or {})
+        self._shards: List[_Shard] = [(threading.Lock(), {}, {}) for _ in range(_SHARDS)]
+        self._seq = itertools.count()
+        for isbn13, row in (initial or {}).items():
+            self._put(self._shard(isbn13), isbn13, row)
+
+    def _shard(self, isbn13: str) -> _Shard:
+        return self._shards[_shard_index(isbn13)]
+
+    def _put(self, shard: _Shard, isbn13: str, row: BookRow) -> None:
+        # Caller holds the shard lock. New keys are appended to both dicts together, so
+        # each shard's rows stay in ascending sequence order.
+        _, rows, seqs = shard
+        if isbn13 not in seqs:
+            seqs[isbn13] = next(self._seq)
+        rows[isbn13] = row
+
+    def _ordered_items(self) -> List[Tuple[str, BookRow]]:
+        per_shard = []
+        for lock, rows, seqs in self._shards:
+            with lock:
+                per_shard.append(list(zip(seqs.values(), rows.items())))
+        return [item for _, item in heapq.merge(*per_shard, key=itemgetter(0))]
 
     def get(self, isbn13: str) -> Optional[BookRow]:
-        with self._lock:
-            return self._rows.get(isbn13)
+        lock, rows, _ = self._shard(isbn13)
+        with lock:
+            return rows.get(isbn13)
 
     def set(self, isbn13: str, row: BookRow) -> None:
-        with self._lock:
-            self._rows[isbn13] = row
+        shard = self._shard(isbn13)
+        with shard[0]:
+            self._put(shard, isbn13, row)
 
     def size(self) -> int:
-        with self._lock:
-            return len(self._rows)
+        # len() of a dict is atomic; no need to take every shard lock for a count.
+        return sum(len(rows) for _, rows, _ in self._shards)
 
     def snapshot_values(self) -> List[BookRow]:
-        with self._lock:
-            return list(self._rows.values())
+        return [row for _, row in self._ordered_items()]
 
     def snapshot_dict(self) -> Dict[str, BookRow]:
-        with self._lock:
-            return dict(self._rows)
+        return dict(self._ordered_items())
 
     def upsert(
         self,
@@ -42,31 +81,36 @@ class RowStore:
         row: BookRow,
         merge_fn: Optional[Callable[[BookRow, BookRow], BookRow]] = None,
     ) -> BookRow:
-        with self._lock:
-            if isbn13 in self._rows:
+        shard = self._shard(isbn13)
+        lock, rows, _ = shard
+        with lock:
+            if isbn13 in rows:
                 if merge_fn is None:
-                    self._rows[isbn13] = row
+                    rows[isbn13] = row
                     return row
-                merged = merge_fn(self._rows[isbn13], row)
-                self._rows[isbn13] = merged
+                merged = merge_fn(rows[isbn13], row)
+                rows[isbn13] = merged
                 return merged
-            self._rows[isbn13] = row
+            self._put(shard, isbn13, row)
             return row
 
     def get_or_set(self, isbn13: str, row_factory: Callable[[], BookRow]) -> BookRow:
-        with self._lock:
-            existing = self._rows.get(isbn13)
+        shard = self._shard(isbn13)
+        lock, rows, _ = shard
+        with lock:
+            existing = rows.get(isbn13)
             if existing is not None:
                 return existing
             row = row_factory()
-            self._rows[isbn13] = row
+            self._put(shard, isbn13, row)
             return row
 
     def update_if_present(self, isbn13: str, updater: Callable[[BookRow], BookRow]) -> Optional[BookRow]:
-        with self._lock:
-            cur = self._rows.get(isbn13)
+        lock, rows, _ = self._shard(isbn13)
+        with lock:
+            cur = rows.get(isbn13)
             if cur is None:
                 return None
             nxt = updater(cur)
-            self._rows[isbn13] = nxt
+            rows[isbn13] = nxt
             return nxt
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import logging
 
@@ -12,35 +13,40 @@ logger = logging.getLogger(__name__)
 from isbn_harvester.core.models import TaskSpec
 
 
-def _read_tasks_file(path: Path) -> Dict[str, List[str]]:
+# libyaml's C loader when available; same safe-load semantics, much faster parse.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _read_tasks_file_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    path = Path(path_str)
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER) or {}
     except FileNotFoundError as e:
         raise SystemExit(f"Tasks file not found: {path}") from e
     except Exception as e:
         raise SystemExit(f"Failed to read tasks file: {path} ({e})") from e
     logger.info("Loaded tasks file: %s", path)
-    out: Dict[str, List[str]] = {}
+    out = []
     for key, value in data.items():
         if isinstance(value, list):
-            out[key] = [str(v) for v in value if str(v).strip()]
-    return out
+            out.append((key, tuple(str(v) for v in value if str(v).strip())))
+    return tuple(out)
 
 
-def _to_pairs(items: Iterable[str], group: str) -> List[tuple[str, str]]:
-    return [(str(x).strip(), group) for x in items if str(x).strip()]
+def _read_tasks_file(path: Path) -> Dict[str, List[str]]:
+    """Parsed tasks file, memoized on (path, mtime, size) so unchanged files are parsed once."""
+    try:
+        st = path.stat()
+    except FileNotFoundError as e:
+        raise SystemExit(f"Tasks file not found: {path}") from e
+    except OSError as e:
+        raise SystemExit(f"Failed to read tasks file: {path} ({e})") from e
+    return {k: list(v) for k, v in _read_tasks_file_cached(str(path), st.st_mtime_ns, st.st_size)}
 
 
-def _dedupe_tasks(tasks: List[TaskSpec]) -> List[TaskSpec]:
-    seen = set()
-    ded = []
-    for t in tasks:
-        k = (t.endpoint, t.query.lower().strip())
-        if k in seen:
-            continue
-        seen.add(k)
-        ded.append(t)
-    return ded
+def _to_pairs(items: Iterable[str], group: str) -> List[tuple[str, str]]:
+    return [(str(x).strip(), group) for x in items if str(x).strip()]
 
 
 def build_tasks(
@@ -71,25 +77,37 @@ def build_tasks(
         base_queries = base_queries + fiction_queries
         intent_queries = intent_queries + fiction_queries
 
+    groups_norm = {g.strip().lower() for g in groups if g.strip()} if groups else None
+    max_tasks = limit if limit is not None and limit > 0 else None
+    seen: Set[Tuple[str, str]] = set()
     out: List[TaskSpec] = []
+
+    # Dedupe, exclude, group filter and limit in one pass as tasks are generated.
+    # A duplicate query counts as seen even if its first group is filtered out.
+    def emit(endpoint: str, query: str, group: str) -> None:
+        if max_tasks is not None and len(out) >= max_tasks:
+            return
+        qn = query.lower().strip()
+        k = (endpoint, qn)
+        if k in seen:
+            return
+        seen.add(k)
+        if qn in exclude_queries:
+            return
+        if groups_norm is not None and group.lower() not in groups_norm:
+            return
+        out.append(TaskSpec(endpoint=endpoint, query=query, group=group))
+
     for pub, g in publishers:
-        out.append(TaskSpec(endpoint="publisher", query=pub, group=g))
+        emit("publisher", pub, g)
     for sub, g in subjects:
-        out.append(TaskSpec(endpoint="subject", query=sub, group=g))
+        emit("subject", sub, g)
     for q in base_queries:
-        out.append(TaskSpec(endpoint="search", query=q, group="alpha"))
+        emit("search", q, "alpha")
     for q in intent_queries:
-        out.append(TaskSpec(endpoint="search", query=q, group="intent"))
+        emit("search", q, "intent")
     for q in children_queries:
-        out.append(TaskSpec(endpoint="search", query=q, group="children"))
-
-    ded = _dedupe_tasks(out)
-    if exclude_queries:
-        ded = [t for t in ded if t.query.lower().strip() not in exclude_queries]
-    if groups:
-        groups_norm = {g.strip().lower() for g in groups if g.strip()}
-        ded = [t for t in ded if t.group.lower() in groups_norm]
-    if limit is not None and limit > 0:
-        ded = ded[:limit]
-    logger.info("Built tasks: %s", len(ded))
-    return ded
+        emit("search", q, "children")
+
+    logger.info("Built tasks: %s", len(out))
+    return out
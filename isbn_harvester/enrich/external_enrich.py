@@ -3,24 +3,36 @@ from __future__ import annotations
 import json
 import logging
 import os
+import random
 import re
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from dataclasses import replace
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import orjson
 import requests
 
 from isbn_harvester.core.models import BookRow
 from isbn_harvester.core.scoring import popularity_proxy, rank_score
 from isbn_harvester.core.normalize import normalize_subject_term
-from isbn_harvester.integrations.http_client import TokenBucket
+from isbn_harvester.integrations.http_client import TokenBucket, make_pooled_session
 
 logger = logging.getLogger(__name__)
 
 _HTML_RE = re.compile(r"<[^>]+>")
-_WS_RE = re.compile(r"\s+")
+
+_OPENLIBRARY_BATCH_SIZE = 50
+
+_CACHE_FLUSH_BYTES = 64 * 1024
+_CACHE_FLUSH_INTERVAL_S = 0.5
+
+# host -> time.monotonic() before which no request should go out (set on 429/5xx).
+_HOST_COOLDOWN: Dict[str, float] = {}
+_HOST_COOLDOWN_LOCK = threading.Lock()
+_MAX_HOST_COOLDOWN_S = 60.0
 
 
 class RateLimitError(RuntimeError):
@@ -34,13 +46,39 @@ class RateLimitError(RuntimeError):
 def _clean_text(text: str, max_len: int = 600) -> str:
     if not text:
         return ""
-    t = _HTML_RE.sub(" ", str(text))
-    t = _WS_RE.sub(" ", t).strip()
+    t = str(text)
+    if "<" in t:
+        t = _HTML_RE.sub(" ", t)
+    # str.split() uses the same whitespace set as re's \s, so this squeezes and strips in one go.
+    t = " ".join(t.split())
     if max_len and len(t) > max_len:
         return t[: max_len - 1].rstrip() + "…"
     return t
 
 
+def _host_of(url: str) -> str:
+    return url.partition("//")[2].partition("/")[0]
+
+
+def _wait_for_host(host: str) -> None:
+    # dict.get is atomic; the lock only serializes updates in _cool_down_host().
+    delay = _HOST_COOLDOWN.get(host, 0.0) - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def _cool_down_host(host: str, delay_s: float) -> None:
+    until = time.monotonic() + delay_s
+    with _HOST_COOLDOWN_LOCK:
+        if until > _HOST_COOLDOWN.get(host, 0.0):
+            _HOST_COOLDOWN[host] = until
+
+
+def _jittered(delay: float) -> float:
+    # Somewhere in [delay/2, delay]: workers that failed together don't all retry together.
+    return delay * (0.5 + random.random() * 0.5)
+
+
 def _get_json_with_retries(
     session: requests.Session,
     url: str,
@@ -53,10 +91,12 @@ def _get_json_with_retries(
     max_body_preview: int = 500,
 ) -> dict:
     backoff = 1.0
+    host = _host_of(url)
     for attempt in range(1, retries + 2):
         try:
+            _wait_for_host(host)
             r = session.get(url, params=params, timeout=timeout_s)
-            if debug:
+            if debug and logger.isEnabledFor(logging.INFO):
                 text = r.text or ""
                 preview = text.replace("\r", " ").replace("\n", " ").strip()
                 if len(preview) > max_body_preview:
@@ -70,43 +110,39 @@ def _get_json_with_retries(
                 )
             if r.status_code in (429, 500, 502, 503, 504):
                 if attempt <= retries:
-                    time.sleep(min(30.0, backoff))
+                    # Back the whole host off, not just this call: the other workers would
+                    # otherwise keep hitting it and collect 429s of their own. The wait
+                    # itself happens in _wait_for_host() at the top of the next attempt.
+                    ra = r.headers.get("Retry-After")
+                    delay = float(ra) if ra and ra.isdigit() else _jittered(backoff)
+                    _cool_down_host(host, min(_MAX_HOST_COOLDOWN_S, delay))
                     backoff = min(30.0, backoff * 2)
                     continue
                 if r.status_code == 429:
                     preview = (r.text or "")[:max_body_preview].replace("\r", " ").replace("\n", " ").strip()
                     raise RateLimitError(label or url, r.status_code, preview)
             r.raise_for_status()
-            return r.json() or {}
+            # orjson straight from the raw bytes: skips requests' charset detection + str decode.
+            return orjson.loads(r.content) or {}
         except Exception:
             if attempt <= retries:
-                time.sleep(min(30.0, backoff))
+                time.sleep(_jittered(min(30.0, backoff)))
                 backoff = min(30.0, backoff * 2)
                 continue
             raise
 
 
-def _merge_text(base: str, extra: str, max_len: int = 600) -> str:
-    base = (base or "").strip()
-    if base:
-        return base
-    extra = _clean_text(extra or "", max_len=max_len)
-    return extra
-
-
 def _merge_subjects(base: str, extra: Iterable[str]) -> str:
-    base_parts = [normalize_subject_term(s) for s in (base or "").split(",") if s.strip()]
-    seen = {s.lower() for s in base_parts}
-    out = [s for s in base_parts if s]
-    for s in extra:
-        val = normalize_subject_term(s)
+    # Base terms are kept as-is (in order); extras are added once each, case-insensitively.
+    out = [v for v in map(normalize_subject_term, base.split(",")) if v] if base else []
+    seen = {v.lower() for v in out}
+    for val in map(normalize_subject_term, extra):
         if not val:
             continue
         key = val.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(val)
+        if key not in seen:
+            seen.add(key)
+            out.append(val)
     return ", ".join(out)
 
 
@@ -126,43 +162,51 @@ def _is_sufficient(subjects: List[str], desc_parts: List[str], *, min_subjects:
     return False
 
 
+# (combined field, payload field) pairs filled by the first payload with a truthy value.
+_COMBINE_FIELDS = (
+    ("title", "title"),
+    ("subtitle", "subtitle"),
+    ("publisher", "publisher"),
+    ("date_published", "publish_date"),
+    ("language", "language"),
+    ("pages", "pages"),
+    ("cover_url", "cover_url"),
+    ("cover_url_original", "cover_url"),
+    ("google_main_category", "google_main_category"),
+)
+
+
+# Starting values for _combine_payloads; copied per call. google_categories is set after
+# the copy so every result gets its own list.
+_EMPTY_COMBINED = {
+    "title": "",
+    "subtitle": "",
+    "authors": "",
+    "publisher": "",
+    "date_published": "",
+    "language": "",
+    "pages": "",
+    "cover_url": "",
+    "cover_url_original": "",
+    "google_main_category": "",
+    "google_categories": None,
+    "google_average_rating": None,
+    "google_ratings_count": None,
+}
+
+
 def _combine_payloads(payloads: List[dict]) -> dict:
-    combined = {
-        "title": "",
-        "subtitle": "",
-        "authors": "",
-        "publisher": "",
-        "date_published": "",
-        "language": "",
-        "pages": "",
-        "cover_url": "",
-        "cover_url_original": "",
-        "google_main_category": "",
-        "google_categories": [],
-        "google_average_rating": None,
-        "google_ratings_count": None,
-    }
+    combined = _EMPTY_COMBINED.copy()
+    combined["google_categories"] = []
+    for dst, src in _COMBINE_FIELDS:
+        for payload in payloads:
+            val = payload.get(src)
+            if val:
+                combined[dst] = val
+                break
     for payload in payloads:
-        if not combined["title"] and payload.get("title"):
-            combined["title"] = payload["title"]
-        if not combined["subtitle"] and payload.get("subtitle"):
-            combined["subtitle"] = payload["subtitle"]
         if not combined["authors"] and payload.get("authors"):
             combined["authors"] = ", ".join([str(a) for a in payload.get("authors") if str(a).strip()])
-        if not combined["publisher"] and payload.get("publisher"):
-            combined["publisher"] = payload["publisher"]
-        if not combined["date_published"] and payload.get("publish_date"):
-            combined["date_published"] = payload["publish_date"]
-        if not combined["language"] and payload.get("language"):
-            combined["language"] = payload["language"]
-        if not combined["pages"] and payload.get("pages"):
-            combined["pages"] = payload["pages"]
-        if not combined["cover_url"] and payload.get("cover_url"):
-            combined["cover_url"] = payload["cover_url"]
-        if not combined["cover_url_original"] and payload.get("cover_url"):
-            combined["cover_url_original"] = payload["cover_url"]
-        if not combined["google_main_category"] and payload.get("google_main_category"):
-            combined["google_main_category"] = payload.get("google_main_category") or ""
         if not combined["google_categories"] and payload.get("google_categories"):
             combined["google_categories"] = [str(c) for c in payload.get("google_categories") if str(c).strip()]
         if combined["google_average_rating"] is None and payload.get("google_average_rating") is not None:
@@ -172,6 +216,16 @@ def _combine_payloads(payloads: List[dict]) -> dict:
     return combined
 
 
+def _safe_number(conv, value, default):
+    """conv(value or 0), or `default` when value is None or doesn't convert."""
+    if value is None:
+        return default
+    try:
+        return conv(value or 0)
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
 def _apply_external_enrichment(
     row: BookRow,
     combined: dict,
@@ -184,8 +238,13 @@ def _apply_external_enrichment(
     merged_subjects = _merge_subjects(row.subjects, subjects)
     merged_ol_subjects = _merge_subjects(row.ol_subjects, ol_subjects)
     merged_loc_subjects = _merge_subjects(row.loc_subjects, loc_subjects)
-    synopsis = _merge_text(row.synopsis, desc, max_len=320)
-    overview = _merge_text(row.overview, desc, max_len=320)
+    synopsis = (row.synopsis or "").strip()
+    overview = (row.overview or "").strip()
+    if not synopsis or not overview:
+        # Both fall back to the same cleaned description; clean it once.
+        cleaned_desc = _clean_text(desc or "", max_len=320)
+        synopsis = synopsis or cleaned_desc
+        overview = overview or cleaned_desc
 
     merged = {
         "title": row.title,
@@ -199,8 +258,6 @@ def _apply_external_enrichment(
         "cover_url_original": row.cover_url_original,
         "google_main_category": row.google_main_category,
         "google_categories": row.google_categories,
-        "google_average_rating": row.google_average_rating,
-        "google_ratings_count": row.google_ratings_count,
     }
 
     for key in ("title", "subtitle", "authors", "publisher", "date_published", "language", "pages"):
@@ -217,23 +274,34 @@ def _apply_external_enrichment(
             [str(c) for c in combined.get("google_categories") if str(c).strip()],
             ensure_ascii=False,
         )
-    if merged["google_average_rating"] in (None, 0.0) and combined.get("google_average_rating") is not None:
-        try:
-            merged["google_average_rating"] = float(combined.get("google_average_rating") or 0.0)
-        except Exception:
-            pass
-    if merged["google_ratings_count"] in (None, 0) and combined.get("google_ratings_count") is not None:
-        try:
-            merged["google_ratings_count"] = int(combined.get("google_ratings_count") or 0)
-        except Exception:
-            pass
-
-    title_long = row.title_long or merged["title"]
-
-    updated = replace(
+    google_average_rating = row.google_average_rating
+    if google_average_rating in (None, 0.0):
+        google_average_rating = _safe_number(float, combined.get("google_average_rating"), google_average_rating)
+    google_ratings_count = row.google_ratings_count
+    if google_ratings_count in (None, 0):
+        google_ratings_count = _safe_number(int, combined.get("google_ratings_count"), google_ratings_count)
+    google_average_rating = float(google_average_rating or 0.0)
+    google_ratings_count = int(google_ratings_count or 0)
+    # Scores come straight from the merged values, so the row is rebuilt only once.
+    updated_pop = popularity_proxy(
+        merged["pages"],
+        merged["date_published"],
+        merged["language"],
+        bool(synopsis),
+        google_average_rating,
+        google_ratings_count,
+    )
+    updated_rank = rank_score(
+        row.jewish_score,
+        updated_pop,
+        row.fiction_flag,
+        fiction_only,
+        row.seen_count,
+    )
+    return replace(
         row,
         title=merged["title"],
-        title_long=title_long,
+        title_long=row.title_long or merged["title"],
         subtitle=merged["subtitle"],
         authors=merged["authors"],
         publisher=merged["publisher"],
@@ -244,30 +312,40 @@ def _apply_external_enrichment(
         cover_url_original=merged["cover_url_original"],
         google_main_category=merged["google_main_category"],
         google_categories=merged["google_categories"],
-        google_average_rating=float(merged.get("google_average_rating") or 0.0),
-        google_ratings_count=int(merged.get("google_ratings_count") or 0),
+        google_average_rating=google_average_rating,
+        google_ratings_count=google_ratings_count,
         subjects=merged_subjects,
         ol_subjects=merged_ol_subjects,
         loc_subjects=merged_loc_subjects,
         synopsis=synopsis,
         overview=overview,
+        popularity_proxy=updated_pop,
+        rank_score=updated_rank,
     )
-    updated_pop = popularity_proxy(
-        updated.pages,
-        updated.date_published,
-        updated.language,
-        bool(updated.synopsis),
-        updated.google_average_rating,
-        updated.google_ratings_count,
-    )
-    updated_rank = rank_score(
-        updated.jewish_score,
-        updated_pop,
-        updated.fiction_flag,
-        fiction_only,
-        updated.seen_count,
-    )
-    return replace(updated, popularity_proxy=updated_pop, rank_score=updated_rank)
+
+
+_OL_COVER_SIZES = ("medium", "large", "small")
+_GOOGLE_COVER_SIZES = ("thumbnail", "smallThumbnail")
+
+
+def _first_present(d: object, keys: Tuple[str, ...]) -> str:
+    """First truthy d[key] in priority order; "" when d isn't a dict or none are set."""
+    if not isinstance(d, dict):
+        return ""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return ""
+
+
+def _google_cover_url(image_links: object) -> str:
+    """Google thumbnail URL upgraded to https, without the page-curl overlay."""
+    url = _first_present(image_links, _GOOGLE_COVER_SIZES)
+    if not url:
+        return ""
+    url = url.replace("&edge=curl", "")
+    return "https://" + url[7:] if url.startswith("http://") else url
 
 
 def _get_openlibrary(
@@ -281,6 +359,26 @@ def _get_openlibrary(
     params = {"bibkeys": f"ISBN:{isbn13}", "format": "json", "jscmd": "data"}
     data = _get_json_with_retries(session, url, params, timeout_s, debug=debug, label="OpenLibrary")
     book = data.get(f"ISBN:{isbn13}", {}) if isinstance(data, dict) else {}
+    return _parse_openlibrary_book(book)
+
+
+def _get_openlibrary_batch(
+    isbn13s: List[str],
+    session: requests.Session,
+    timeout_s: int,
+    *,
+    debug: bool = False,
+) -> Dict[str, Tuple[dict, List[str], str]]:
+    """One Books API call for several ISBNs; ISBNs missing from the response parse as empty."""
+    url = "https://openlibrary.org/api/books"
+    params = {"bibkeys": ",".join(f"ISBN:{i}" for i in isbn13s), "format": "json", "jscmd": "data"}
+    data = _get_json_with_retries(session, url, params, timeout_s, debug=debug, label="OpenLibraryBatch")
+    if not isinstance(data, dict):
+        data = {}
+    return {i: _parse_openlibrary_book(data.get(f"ISBN:{i}", {})) for i in isbn13s}
+
+
+def _parse_openlibrary_book(book: dict) -> Tuple[dict, List[str], str]:
     subjects = []
     for sub in book.get("subjects") or []:
         name = sub.get("name") if isinstance(sub, dict) else str(sub)
@@ -314,13 +412,10 @@ def _get_openlibrary(
     if languages:
         lang = languages[0]
         if isinstance(lang, dict):
-            key = lang.get("key") or ""
-            payload["language"] = key.rsplit("/", 1)[-1] if "/" in key else key
+            payload["language"] = (lang.get("key") or "").rpartition("/")[2]
         else:
             payload["language"] = str(lang)
-    cover = book.get("cover") or {}
-    if isinstance(cover, dict):
-        payload["cover_url"] = cover.get("medium") or cover.get("large") or cover.get("small") or ""
+    payload["cover_url"] = _first_present(book.get("cover"), _OL_COVER_SIZES)
     return payload, subjects, str(desc or "")
 
 
@@ -393,9 +488,7 @@ def _get_google_books(
         "google_average_rating": info.get("averageRating"),
         "google_ratings_count": info.get("ratingsCount"),
     }
-    image_links = info.get("imageLinks") or {}
-    if isinstance(image_links, dict):
-        payload["cover_url"] = image_links.get("thumbnail") or image_links.get("smallThumbnail") or ""
+    payload["cover_url"] = _google_cover_url(info.get("imageLinks"))
     return payload, [str(s) for s in subjects if str(s).strip()], str(desc or "")
 
 
@@ -447,9 +540,7 @@ def _get_google_books_search(
         "google_average_rating": info.get("averageRating"),
         "google_ratings_count": info.get("ratingsCount"),
     }
-    image_links = info.get("imageLinks") or {}
-    if isinstance(image_links, dict):
-        payload["cover_url"] = image_links.get("thumbnail") or image_links.get("smallThumbnail") or ""
+    payload["cover_url"] = _google_cover_url(info.get("imageLinks"))
     return payload, [str(s) for s in subjects if str(s).strip()], str(desc or "")
 
 
@@ -478,7 +569,8 @@ def _find_loc_record(results: List[dict], isbn13: str) -> Optional[dict]:
         isbns = rec.get("isbn") or []
         if isinstance(isbns, str):
             isbns = [isbns]
-        if any(isbn13 == str(i).replace("-", "") for i in isbns):
+        # Most records list bare ISBNs, so try a plain membership test before stripping dashes.
+        if isbn13 in isbns or any(isbn13 == str(i).replace("-", "") for i in isbns):
             return rec
     return results[0]
 
@@ -531,6 +623,22 @@ def _get_loc(
     return payload, [s for s in subjects if s.strip()], str(desc or "")
 
 
+# Cache records start with their isbn13 key: compact from orjson, ": "-separated from
+# caches written by older versions with json.dumps.
+_CACHE_LINE_PREFIXES = (b'{"isbn13":"', b'{"isbn13": "')
+
+
+def _cache_line_isbn(line: bytes) -> Optional[str]:
+    """isbn13 of a cache line read off its prefix, or None when it needs a full parse."""
+    for prefix in _CACHE_LINE_PREFIXES:
+        if line.startswith(prefix):
+            start = len(prefix)
+            end = line.find(b'"', start)
+            if end > start:
+                return line[start:end].decode("ascii", "replace")
+    return None
+
+
 def _should_enrich(row: BookRow, enrich_all: bool) -> bool:
     if enrich_all:
         return True
@@ -566,8 +674,11 @@ def enrich_rows(
     rows = list(rows)
     if not rows:
         return []
+    # Every debug line is logger.info; settle once whether any of them would be emitted,
+    # so a disabled logger also skips the per-call params dicts and body previews.
+    debug = debug and logger.isEnabledFor(logging.INFO)
 
-    rows.sort(key=lambda r: r.rank_score, reverse=True)
+    rows.sort(key=attrgetter("rank_score"), reverse=True)
     targets = [r for r in rows if _should_enrich(r, enrich_all)]
     if max_rows and max_rows > 0:
         targets = targets[:max_rows]
@@ -579,41 +690,53 @@ def enrich_rows(
     limiter_google = TokenBucket(rate_per_sec, burst)
     limiter_loc = TokenBucket(rate_per_sec, burst)
     updated = {r.isbn13: r for r in rows if r.isbn13}
-    local = threading.local()
+    # One pooled session for all workers: each worker has at most one request in flight,
+    # so a per-host pool of `concurrency` connections keeps every keep-alive reusable
+    # across threads instead of each thread opening its own to all three APIs.
+    session = make_pooled_session(concurrency)
     cache_lock = threading.Lock()
     cache_data = {}
     cache_fh = None
+    # New cache records are buffered and written in chunks (like CheckpointWriter) rather
+    # than write+flush per row; anything still buffered is written when the run ends.
+    cache_buf = bytearray()
+    cache_last_flush = [time.monotonic()]
     stats = {"hits": 0, "misses": 0, "writes": 0}
     loc_lock = threading.Lock()
     loc_state = {"disabled": False, "failures": 0}
+    ol_prefetched: Dict[str, Tuple[dict, List[str], str]] = {}
 
     if cache_path:
         try:
             os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
-            with open(cache_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        rec = json.loads(line)
-                    except Exception:
-                        continue
-                    isbn = rec.get("isbn13") or ""
-                    if not isbn:
-                        continue
-                    cache_data[isbn] = rec
-            cache_fh = open(cache_path, "a", encoding="utf-8")
+            # Only this run's targets are ever looked up, so skip (without parsing) the
+            # records of every other ISBN; the cache can be far larger than the target set.
+            wanted = {r.isbn13 for r in targets if r.isbn13}
+            try:
+                with open(cache_path, "rb") as f:
+                    for line in f:
+                        isbn = _cache_line_isbn(line)
+                        if isbn is not None and isbn not in wanted:
+                            continue
+                        try:
+                            rec = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue
+                        if not isinstance(rec, dict):
+                            continue
+                        isbn = rec.get("isbn13") or ""
+                        if not isbn or isbn not in wanted:
+                            continue
+                        cache_data[isbn] = rec
+            except FileNotFoundError:
+                pass
+            cache_fh = open(cache_path, "ab")
         except Exception as e:
             logger.warning("External enrich cache unavailable: %r", e)
             cache_data = {}
             cache_fh = None
 
     def _enrich_one(row: BookRow) -> BookRow:
-        session = getattr(local, "session", None)
-        if session is None:
-            session = requests.Session()
-            local.session = session
         if debug:
             logger.info("Enrich start %s", row.isbn13)
         if row.isbn13 and row.isbn13 in cache_data:
@@ -638,15 +761,20 @@ def enrich_rows(
         loc_subjects: List[str] = []
 
         if enable_openlibrary:
-            limiter_openlibrary.take(1.0)
+            prefetched = ol_prefetched.get(row.isbn13)
+            if prefetched is None:
+                limiter_openlibrary.take(1.0)
             try:
-                if debug:
-                    logger.info(
-                        "OpenLibrary request %s params=%s",
-                        "https://openlibrary.org/api/books",
-                        {"bibkeys": f"ISBN:{row.isbn13}", "format": "json", "jscmd": "data"},
-                    )
-                payload, s, d = _get_openlibrary(row.isbn13, session, timeout_s, debug=debug)
+                if prefetched is not None:
+                    payload, s, d = prefetched
+                else:
+                    if debug:
+                        logger.info(
+                            "OpenLibrary request %s params=%s",
+                            "https://openlibrary.org/api/books",
+                            {"bibkeys": f"ISBN:{row.isbn13}", "format": "json", "jscmd": "data"},
+                        )
+                    payload, s, d = _get_openlibrary(row.isbn13, session, timeout_s, debug=debug)
                 payloads.append(payload)
                 subjects.extend(s)
                 ol_subjects.extend(s)
@@ -656,6 +784,9 @@ def enrich_rows(
                     logger.info("OpenLibrary %s subjects=%s desc_len=%s", row.isbn13, len(s), len(d or ""))
                 has_ol = bool(s or d or _payload_has_data([payload]))
                 if openlibrary_fallback and not has_ol and (row.title or row.authors):
+                    if prefetched is not None:
+                        # The batch prefetch spent no per-row token, so the search pays its own.
+                        limiter_openlibrary.take(1.0)
                     if debug:
                         logger.info("OpenLibrary fallback search %s", row.isbn13)
                     spayload, ss, sd = _get_openlibrary_search(row.title, row.authors, session, timeout_s, debug=debug)
@@ -770,11 +901,17 @@ def enrich_rows(
                 "ol_subjects": ol_subjects,
                 "loc_subjects": loc_subjects,
             }
+            data = orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE)
             with cache_lock:
                 cache_data[row.isbn13] = rec
-                cache_fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
-                cache_fh.flush()
+                cache_buf.extend(data)
                 stats["writes"] += 1
+                now = time.monotonic()
+                if len(cache_buf) >= _CACHE_FLUSH_BYTES or now - cache_last_flush[0] >= _CACHE_FLUSH_INTERVAL_S:
+                    cache_fh.write(cache_buf)
+                    cache_fh.flush()
+                    cache_buf.clear()
+                    cache_last_flush[0] = now
         if debug:
             logger.info(
                 "Enrich done %s subjects=%s desc_len=%s",
@@ -792,19 +929,47 @@ def enrich_rows(
         enable_loc,
     )
 
-    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
-        future_map = {ex.submit(_enrich_one, row): row.isbn13 for row in targets}
-        for fut in as_completed(future_map):
-            isbn = future_map[fut]
-            try:
-                updated_row = fut.result()
-                if updated_row.isbn13:
-                    updated[updated_row.isbn13] = updated_row
-            except Exception as e:
-                logger.debug("External enrich failed %s: %r", isbn, e)
+    def _enrich_one_safe(row: BookRow) -> Optional[BookRow]:
+        # Executor.map re-raises the first failure, so failures are contained per row here.
+        try:
+            return _enrich_one(row)
+        except Exception as e:
+            logger.debug("External enrich failed %s: %r", row.isbn13, e)
+            return None
 
-    if cache_fh:
-        cache_fh.close()
+    def _prefetch_openlibrary(isbn13s: List[str]) -> None:
+        limiter_openlibrary.take(1.0)
+        try:
+            found = _get_openlibrary_batch(isbn13s, session, timeout_s, debug=debug)
+        except Exception as e:
+            # These rows fall back to one OpenLibrary call each in _enrich_one.
+            logger.debug("OpenLibrary batch failed (%s ISBNs): %r", len(isbn13s), e)
+            return
+        ol_prefetched.update(found)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
+            if enable_openlibrary:
+                # The Books API takes many bibkeys per request, so fetch OpenLibrary for all
+                # uncached targets up front in batches instead of one request per row. Batches
+                # are cut from ISBN order so each one covers a narrow publisher-prefix range.
+                pending = sorted(r.isbn13 for r in targets if r.isbn13 and r.isbn13 not in cache_data)
+                batches = [pending[i : i + _OPENLIBRARY_BATCH_SIZE] for i in range(0, len(pending), _OPENLIBRARY_BATCH_SIZE)]
+                for _ in ex.map(_prefetch_openlibrary, batches):
+                    pass
+                if batches:
+                    logger.info("OpenLibrary prefetch: %s of %s ISBNs in %s requests", len(ol_prefetched), len(pending), len(batches))
+
+            for updated_row in ex.map(_enrich_one_safe, targets):
+                if updated_row is not None and updated_row.isbn13:
+                    updated[updated_row.isbn13] = updated_row
+    finally:
+        session.close()
+        if cache_fh:
+            with cache_lock:
+                cache_fh.write(cache_buf)
+                cache_buf.clear()
+                cache_fh.close()
     if cache_stats is not None:
         cache_stats.update(stats)
 
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+import orjson
 
 from isbn_harvester.core.models import BookRow
 from isbn_harvester.io.export_full import write_full_csv
 
 HTML_RE = re.compile(r"<[^>]+>")
-NON_WORD_RE = re.compile(r"[^0-9a-zA-Z\s]+")
-WS_RE = re.compile(r"\s+")
+WORD_RE = re.compile(r"[0-9a-zA-Z]+")
 
 FIELD_WEIGHTS = {
     "title": 3.0,
@@ -62,17 +66,24 @@ DEFAULT_MULTI_THRESHOLD = 4.0
 DEFAULT_MULTI_MAX = 4
 PRIMARY_FALLBACK_THRESHOLD = 4.5
 SINGLE_AXES = {"primary_genre", "content_type"}
+# Below this many rows per extra process, pool startup costs more than it saves.
+MIN_ROWS_PER_WORKER = 250
 
 
 def _clean_text(text: str) -> str:
     if not text:
         return ""
-    t = HTML_RE.sub(" ", str(text))
-    t = t.replace("&", " and ")
-    t = t.replace("_", " ")
-    t = NON_WORD_RE.sub(" ", t)
-    t = WS_RE.sub(" ", t).strip().lower()
-    return t
+    t = str(text)
+    if "<" in t:
+        t = HTML_RE.sub(" ", t)
+    # Keep only ASCII alphanumeric runs, single-space separated; lower() last so non-ASCII
+    # letters that lowercase to ASCII (e.g. the Kelvin sign) are still dropped.
+    return " ".join(WORD_RE.findall(t.replace("&", " and "))).lower()
+
+
+def _json_list(values: Optional[List[str]]) -> str:
+    # Most axes assign nothing; skip the encoder for those.
+    return orjson.dumps(values).decode() if values else "[]"
 
 
 def _parse_json_list(value: str) -> List[str]:
@@ -92,15 +103,23 @@ def _parse_json_list(value: str) -> List[str]:
 def _jsonl_write(path: Optional[str], obj: dict) -> None:
     if not path:
         return
+    with _open_jsonl(path) as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE))
+
+
+def _open_jsonl(path: str, buffering: int = -1) -> BinaryIO:
     Path(path).parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    return open(path, "ab", buffering=buffering)
 
 
 def _load_taxonomy(path: str) -> Tuple[dict, Dict[str, List[dict]]]:
     data = json.loads(Path(path).read_text(encoding="utf-8"))
     meta = data.get("meta") if isinstance(data, dict) else {}
     taxonomy = {k: list(v) for k, v in data.items() if k != "meta" and isinstance(v, list)}
+    for nodes in taxonomy.values():
+        for node in nodes:
+            if isinstance(node, dict):
+                node["_compiled"] = _compile_node(node)
     return meta or {}, taxonomy
 
 
@@ -118,20 +137,23 @@ def _extract_signals(signals: dict) -> Tuple[List[str], List[str], List[str]]:
     return keywords, phrases, regex
 
 
-def _default_fields() -> List[str]:
-    return [
-        "title",
-        "subtitle",
-        "title_long",
-        "overview",
-        "synopsis",
-        "description",
-        "excerpt",
-        "subjects",
-        "ol_subjects",
-        "loc_subjects",
-        "publisher",
-    ]
+_DEFAULT_FIELDS = (
+    "title",
+    "subtitle",
+    "title_long",
+    "overview",
+    "synopsis",
+    "description",
+    "excerpt",
+    "subjects",
+    "ol_subjects",
+    "loc_subjects",
+    "publisher",
+)
+
+
+def _default_fields() -> Tuple[str, ...]:
+    return _DEFAULT_FIELDS
 
 
 def _field_weight(field: str, field_weights: Optional[dict]) -> float:
@@ -143,80 +165,113 @@ def _field_weight(field: str, field_weights: Optional[dict]) -> float:
     return float(FIELD_WEIGHTS.get(field, 1.0))
 
 
-def _match_keyword(term: str, text: str) -> bool:
-    if not term:
-        return False
-    return re.search(rf"\b{re.escape(term)}\b", text) is not None
+def _compile_terms(keywords: List[str], phrases: List[str], regexes: List[str]) -> dict:
+    phrase_terms = []
+    for phrase in phrases:
+        phrase_norm = _clean_text(phrase)
+        if phrase_norm:
+            phrase_terms.append((phrase, phrase_norm))
+    keyword_terms = []
+    for kw in keywords:
+        kw_norm = _clean_text(kw)
+        if kw_norm:
+            # Doc text is _clean_text output (lowercase alphanumerics separated by single
+            # spaces), so a word-boundary match is exactly a space-delimited substring hit.
+            keyword_terms.append((kw, f" {kw_norm} "))
+    regex_terms = []
+    for rx in regexes:
+        try:
+            regex_terms.append((rx, re.compile(rx)))
+        except re.error:
+            continue
+    return {
+        "phrases": phrase_terms,
+        "keywords": keyword_terms,
+        "regexes": regex_terms,
+    }
 
 
-def _score_node(node: dict, doc: dict, field_weights: Optional[dict]) -> Tuple[float, List[dict]]:
-    signals = node.get("signals") or {}
-    neg = node.get("negative_signals") or {}
+def _compile_node(node: dict) -> dict:
+    """Normalized terms and compiled patterns for a node, built once when the taxonomy loads."""
+    keywords, phrases, regexes = _extract_signals(node.get("signals") or {})
+    neg_keywords, neg_phrases, neg_regexes = _extract_signals(node.get("negative_signals") or {})
+    return {
+        "pos": _compile_terms(keywords, phrases, regexes),
+        "neg": _compile_terms(neg_keywords, neg_phrases, neg_regexes),
+    }
+
+
+def _row_field_weights(doc: dict, field_weights: Optional[dict]) -> Dict[str, float]:
+    """Weight of each default field that has text in this doc, in default-field order."""
+    return {field: _field_weight(field, field_weights) for field in _DEFAULT_FIELDS if doc.get(field)}
+
+
+def _score_node(
+    node: dict,
+    doc: dict,
+    field_weights: Optional[dict],
+    row_weights: Optional[Dict[str, float]] = None,
+) -> Tuple[float, List[dict]]:
+    compiled = node.get("_compiled")
+    if compiled is None:
+        # Taxonomies built by hand rather than via _load_taxonomy get compiled on first use.
+        compiled = node["_compiled"] = _compile_node(node)
+    pos = compiled["pos"]
+    neg = compiled["neg"]
     weight = float(node.get("weight") or 1.0)
     calibration = node.get("calibration") or {}
-    fields = node.get("applies_to_fields") or _default_fields()
-    if not isinstance(fields, list) or not fields:
-        fields = _default_fields()
-    if not any(doc.get(field) for field in fields):
-        fields = _default_fields()
-
-    keywords, phrases, regexes = _extract_signals(signals)
-    neg_keywords, neg_phrases, neg_regexes = _extract_signals(neg)
+    if row_weights is None:
+        row_weights = _row_field_weights(doc, field_weights)
+    # Only fields with text are visited; a node whose own fields are all empty falls
+    # back to every non-empty default field.
+    fields = node.get("applies_to_fields")
+    fields = [field for field in fields if doc.get(field)] if isinstance(fields, list) else None
+    if not fields:
+        fields = row_weights
 
     total = 0.0
     matches: List[dict] = []
 
     for field in fields:
-        text = doc.get(field, "")
-        if not text:
-            continue
-        fweight = _field_weight(field, field_weights)
+        text = doc[field]
+        fweight = row_weights[field] if field in row_weights else _field_weight(field, field_weights)
+        padded = f" {text} "
 
-        for phrase in phrases:
-            phrase_norm = _clean_text(phrase)
-            if phrase_norm and phrase_norm in text:
+        for phrase, phrase_norm in pos["phrases"]:
+            if phrase_norm in text:
                 points = 2.5 * fweight
                 total += points
                 matches.append({"field": field, "term": phrase, "type": "phrase", "points": points})
 
-        for kw in keywords:
-            kw_norm = _clean_text(kw)
-            if kw_norm and _match_keyword(kw_norm, text):
+        for kw, kw_padded in pos["keywords"]:
+            if kw_padded in padded:
                 points = 1.0 * fweight
                 total += points
                 matches.append({"field": field, "term": kw, "type": "keyword", "points": points})
 
-        for rx in regexes:
-            try:
-                if re.search(rx, text):
-                    points = 4.0 * fweight
-                    total += points
-                    matches.append({"field": field, "term": rx, "type": "regex", "points": points})
-            except re.error:
-                continue
+        for rx, pattern in pos["regexes"]:
+            if pattern.search(text):
+                points = 4.0 * fweight
+                total += points
+                matches.append({"field": field, "term": rx, "type": "regex", "points": points})
 
-        for phrase in neg_phrases:
-            phrase_norm = _clean_text(phrase)
-            if phrase_norm and phrase_norm in text:
+        for phrase, phrase_norm in neg["phrases"]:
+            if phrase_norm in text:
                 points = -3.0 * fweight
                 total += points
                 matches.append({"field": field, "term": phrase, "type": "negative_phrase", "points": points})
 
-        for kw in neg_keywords:
-            kw_norm = _clean_text(kw)
-            if kw_norm and _match_keyword(kw_norm, text):
+        for kw, kw_padded in neg["keywords"]:
+            if kw_padded in padded:
                 points = -2.0 * fweight
                 total += points
                 matches.append({"field": field, "term": kw, "type": "negative_keyword", "points": points})
 
-        for rx in neg_regexes:
-            try:
-                if re.search(rx, text):
-                    points = -3.0 * fweight
-                    total += points
-                    matches.append({"field": field, "term": rx, "type": "negative_regex", "points": points})
-            except re.error:
-                continue
+        for rx, pattern in neg["regexes"]:
+            if pattern.search(text):
+                points = -3.0 * fweight
+                total += points
+                matches.append({"field": field, "term": rx, "type": "negative_regex", "points": points})
 
     total = total * weight
     min_score = calibration.get("min_score")
@@ -258,6 +313,15 @@ def assign_taxonomy(
     review_queue_path: Optional[str] = None,
     debug_path: Optional[str] = None,
 ) -> BookRow:
+    out, review, debug = _classify(row, taxonomy, meta)
+    if review is not None:
+        _jsonl_write(review_queue_path, review)
+    _jsonl_write(debug_path, debug)
+    return out
+
+
+def _classify(row: BookRow, taxonomy: Dict[str, List[dict]], meta: dict) -> Tuple[BookRow, Optional[dict], dict]:
+    """Tagged row plus its review-queue record (None when nothing to review) and debug record."""
     doc = _build_doc(row)
     assignments: Dict[str, List[dict]] = {}
     reasons: List[str] = []
@@ -265,11 +329,12 @@ def assign_taxonomy(
     field_weights = defaults.get("field_weights") or {}
     thresholds = defaults.get("thresholds") or {}
     caps = defaults.get("caps") or {}
+    row_weights = _row_field_weights(doc, field_weights)
 
     for axis, nodes in taxonomy.items():
         scored = []
         for node in nodes:
-            score, matches = _score_node(node, doc, field_weights)
+            score, matches = _score_node(node, doc, field_weights, row_weights)
             if score <= 0:
                 continue
             scored.append(
@@ -336,13 +401,17 @@ def assign_taxonomy(
 
     taxonomy_tags = []
     for axis, ids in assigned_ids.items():
+        # First (highest-scoring) entry per id, as the old linear scan returned.
+        by_id: Dict[str, dict] = {}
+        for a in assignments[axis]:
+            by_id.setdefault(a["id"], a)
         if axis == "primary_genre" and ids:
-            match = next((a for a in assignments[axis] if a["id"] == ids[0]), None)
+            match = by_id.get(ids[0])
             if match:
                 taxonomy_tags.append(f"{AXIS_TAG_PREFIX.get(axis, axis.title())}: {match['label']}")
         else:
             for cid in ids:
-                match = next((a for a in assignments[axis] if a["id"] == cid), None)
+                match = by_id.get(cid)
                 if match:
                     prefix = AXIS_TAG_PREFIX.get(axis, axis.title())
                     taxonomy_tags.append(f"{prefix}: {match['label']}")
@@ -350,55 +419,69 @@ def assign_taxonomy(
     for hl in high_levels:
         taxonomy_tags.append(f"{AXIS_TAG_PREFIX.get('high_level_categories', 'High')}: {hl}")
 
+    assigned_sets = {axis: set(ids) for axis, ids in assigned_ids.items()}
     confidence = {
         "assigned": {k: v for k, v in assigned_ids.items()},
         "evidence": {
             axis: [
                 {"id": s["id"], "score": s["score"], "matches": s["matches"]}
                 for s in assignments.get(axis, [])
-                if s["id"] in assigned_ids.get(axis, [])
+                if s["id"] in assigned_sets.get(axis, ())
             ]
             for axis in assignments
         },
     }
 
+    review = None
     if reasons:
-        _jsonl_write(
-            review_queue_path,
-            {
-                "isbn13": row.isbn13,
-                "title": row.title,
-                "reasons": reasons,
-                "assigned": assigned_ids,
-            },
-        )
-
-    _jsonl_write(
-        debug_path,
-        {
+        review = {
             "isbn13": row.isbn13,
             "title": row.title,
-            "assignments": assignments,
-        },
-    )
+            "reasons": reasons,
+            "assigned": assigned_ids,
+        }
+    debug = {
+        "isbn13": row.isbn13,
+        "title": row.title,
+        "assignments": assignments,
+    }
 
     return replace(
         row,
         taxonomy_content_type=(assigned_ids.get("content_type") or [""])[0],
         taxonomy_primary_genre=(assigned_ids.get("primary_genre") or [""])[0],
-        taxonomy_jewish_themes=json.dumps(assigned_ids.get("jewish_themes", []), ensure_ascii=False),
-        taxonomy_geography=json.dumps(assigned_ids.get("geography", []), ensure_ascii=False),
-        taxonomy_historical_era=json.dumps(assigned_ids.get("historical_era", []), ensure_ascii=False),
-        taxonomy_religious_orientation=json.dumps(assigned_ids.get("religious_orientation", []), ensure_ascii=False),
-        taxonomy_cultural_tradition=json.dumps(assigned_ids.get("cultural_tradition", []), ensure_ascii=False),
-        taxonomy_language=json.dumps(assigned_ids.get("language", []), ensure_ascii=False),
-        taxonomy_character_focus=json.dumps(assigned_ids.get("character_focus", []), ensure_ascii=False),
-        taxonomy_narrative_style=json.dumps(assigned_ids.get("narrative_style", []), ensure_ascii=False),
-        taxonomy_emotional_tone=json.dumps(assigned_ids.get("emotional_tone", []), ensure_ascii=False),
-        taxonomy_high_level_categories=json.dumps(high_levels, ensure_ascii=False),
-        taxonomy_confidence=json.dumps(confidence, ensure_ascii=False),
+        taxonomy_jewish_themes=_json_list(assigned_ids.get("jewish_themes")),
+        taxonomy_geography=_json_list(assigned_ids.get("geography")),
+        taxonomy_historical_era=_json_list(assigned_ids.get("historical_era")),
+        taxonomy_religious_orientation=_json_list(assigned_ids.get("religious_orientation")),
+        taxonomy_cultural_tradition=_json_list(assigned_ids.get("cultural_tradition")),
+        taxonomy_language=_json_list(assigned_ids.get("language")),
+        taxonomy_character_focus=_json_list(assigned_ids.get("character_focus")),
+        taxonomy_narrative_style=_json_list(assigned_ids.get("narrative_style")),
+        taxonomy_emotional_tone=_json_list(assigned_ids.get("emotional_tone")),
+        taxonomy_high_level_categories=_json_list(high_levels),
+        taxonomy_confidence=orjson.dumps(confidence).decode(),
         taxonomy_tags=", ".join(taxonomy_tags),
-    )
+    ), review, debug
+
+
+# Per-process state for apply_taxonomy's worker pool, set once by _worker_init.
+_WORKER: dict = {}
+
+
+def _worker_init(taxonomy: Dict[str, List[dict]], meta: dict, keep_review: bool, keep_debug: bool) -> None:
+    _WORKER.update(taxonomy=taxonomy, meta=meta, keep_review=keep_review, keep_debug=keep_debug)
+
+
+def _classify_chunk(rows: List[BookRow]) -> List[Tuple[BookRow, Optional[dict], Optional[dict]]]:
+    # Records nobody will write are dropped here so they aren't pickled back to the parent.
+    out = []
+    for row in rows:
+        tagged, review, debug = _classify(row, _WORKER["taxonomy"], _WORKER["meta"])
+        out.append(
+            (tagged, review if _WORKER["keep_review"] else None, debug if _WORKER["keep_debug"] else None)
+        )
+    return out
 
 
 def apply_taxonomy(
@@ -409,16 +492,31 @@ def apply_taxonomy(
     debug_path: Optional[str] = None,
     snapshot_every_s: int = 0,
     snapshot_dir: Optional[str] = None,
+    workers: int = 1,
 ) -> List[BookRow]:
+    """
+    Tag every row against the taxonomy. workers > 1 (or 0 = one per CPU) classifies chunks of
+    rows in a process pool; output rows and JSONL records keep input order either way.
+    """
     meta, taxonomy = _load_taxonomy(taxonomy_path)
+    rows = list(rows)
     out: List[BookRow] = []
     last_snap = time.time()
     if snapshot_dir:
         Path(snapshot_dir).mkdir(parents=True, exist_ok=True)
-    for row in rows:
-        out.append(
-            assign_taxonomy(row, taxonomy, meta, review_queue_path=review_queue_path, debug_path=debug_path)
-        )
+
+    # Each JSONL output is opened once for the whole run rather than once per row.
+    files = ExitStack()
+    review_fh = files.enter_context(_open_jsonl(review_queue_path, 1 << 20)) if review_queue_path else None
+    debug_fh = files.enter_context(_open_jsonl(debug_path, 1 << 20)) if debug_path else None
+
+    def _emit(tagged: BookRow, review: Optional[dict], debug: Optional[dict]) -> None:
+        nonlocal last_snap
+        if review is not None and review_fh is not None:
+            review_fh.write(orjson.dumps(review, option=orjson.OPT_APPEND_NEWLINE))
+        if debug is not None and debug_fh is not None:
+            debug_fh.write(orjson.dumps(debug, option=orjson.OPT_APPEND_NEWLINE))
+        out.append(tagged)
         if snapshot_every_s and snapshot_every_s > 0 and snapshot_dir:
             now = time.time()
             if now - last_snap >= snapshot_every_s:
@@ -426,4 +524,23 @@ def apply_taxonomy(
                 snap_path = str(Path(snapshot_dir) / f"taxonomy_snapshot_{ts}.csv")
                 write_full_csv(out, snap_path)
                 last_snap = now
+
+    n_workers = workers if workers > 0 else (os.cpu_count() or 1)
+    n_workers = min(n_workers, len(rows) // MIN_ROWS_PER_WORKER)
+    with files:
+        if n_workers <= 1:
+            for row in rows:
+                _emit(*_classify(row, taxonomy, meta))
+            return out
+
+        chunk_size = max(1, len(rows) // (4 * n_workers))
+        chunks = [rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_worker_init,
+            initargs=(taxonomy, meta, bool(review_queue_path), bool(debug_path)),
+        ) as ex:
+            for results in ex.map(_classify_chunk, chunks):
+                for result in results:
+                    _emit(*result)
     return out
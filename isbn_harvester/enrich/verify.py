@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import logging
-import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import replace
-from typing import Iterable, List, Optional, Tuple
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import requests
 
 from isbn_harvester.core.models import BookRow
+from isbn_harvester.integrations.http_client import make_pooled_session
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +18,19 @@ def _choose_cover_url(r: BookRow) -> str:
     return (r.cloudfront_cover_url or r.cover_url_original or r.cover_url or "").strip()
 
 
+def _is_image(r: requests.Response) -> bool:
+    return (r.headers.get("Content-Type") or "").lower().startswith("image/")
+
+
 def _check_url(session: requests.Session, url: str, timeout_s: int) -> bool:
     try:
         r = session.head(url, timeout=timeout_s, allow_redirects=True)
         if r.status_code >= 400:
-            r = session.get(url, timeout=timeout_s, stream=True)
-        if r.status_code >= 400:
-            return False
-        ctype = (r.headers.get("Content-Type") or "").lower()
-        return ctype.startswith("image/")
+            # Headers are all we need; close the streamed response right away so its
+            # connection is released now rather than whenever it gets garbage-collected.
+            with session.get(url, timeout=timeout_s, stream=True) as r:
+                return r.status_code < 400 and _is_image(r)
+        return _is_image(r)
     except Exception:
         return False
 
@@ -34,8 +39,8 @@ def _verify_one(row: BookRow, timeout_s: int) -> Tuple[BookRow, bool]:
     url = _choose_cover_url(row)
     if not url:
         return row, True
-    sess = requests.Session()
-    return _verify_one_with_session(row, url, sess, timeout_s)
+    with requests.Session() as sess:
+        return _verify_one_with_session(row, url, sess, timeout_s)
 
 
 def _verify_one_with_session(
@@ -47,7 +52,11 @@ def _verify_one_with_session(
     ok = _check_url(session, url, timeout_s)
     if ok:
         return row, True
-    cleared = replace(
+    return _clear_cover(row), False
+
+
+def _clear_cover(row: BookRow) -> BookRow:
+    return replace(
         row,
         cover_url="",
         cover_url_original="",
@@ -55,7 +64,6 @@ def _verify_one_with_session(
         s3_cover_key="",
         cover_expires_at=0,
     )
-    return cleared, False
 
 
 def verify_rows(
@@ -66,7 +74,7 @@ def verify_rows(
     timeout_s: int = 10,
 ) -> List[BookRow]:
     rows = list(rows)
-    rows.sort(key=lambda r: r.rank_score, reverse=True)
+    rows.sort(key=attrgetter("rank_score"), reverse=True)
     if not rows:
         return []
 
@@ -78,31 +86,38 @@ def verify_rows(
     verified: List[Optional[BookRow]] = [None] * verify_count
     failures = 0
 
-    local = threading.local()
+    # One pooled session for all workers (each has at most one check in flight), so
+    # keep-alive connections to the cover hosts are shared instead of opened per thread.
+    session = make_pooled_session(concurrency)
 
-    def _verify_row(row: BookRow) -> Tuple[BookRow, bool]:
+    # Rows sharing a cover URL (reused publisher art, templated CDN paths) are checked
+    # once; the first row in the group carries the request and the result is applied to all.
+    groups: Dict[str, List[int]] = {}
+    for i, row in enumerate(verify_rows_list):
         url = _choose_cover_url(row)
-        if not url:
-            return row, True
-        sess = getattr(local, "session", None)
-        if sess is None:
-            sess = requests.Session()
-            local.session = sess
-        return _verify_one_with_session(row, url, sess, timeout_s)
+        if url:
+            groups.setdefault(url, []).append(i)
+        else:
+            verified[i] = row
 
-    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
+    with session, ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
         future_map = {
-            ex.submit(_verify_row, row): i for i, row in enumerate(verify_rows_list)
+            ex.submit(_verify_one_with_session, verify_rows_list[idxs[0]], url, session, timeout_s): idxs
+            for url, idxs in groups.items()
         }
         for fut in as_completed(future_map):
-            idx = future_map[fut]
-            row, ok = fut.result()
+            idxs = future_map[fut]
+            first, ok = fut.result()
+            verified[idxs[0]] = first
+            for idx in idxs[1:]:
+                row = verify_rows_list[idx]
+                verified[idx] = row if ok else _clear_cover(row)
             if not ok:
-                failures += 1
-                logger.warning("verify: cover failed %s", row.isbn13)
-            verified[idx] = row
+                failures += len(idxs)
+                for idx in idxs:
+                    logger.warning("verify: cover failed %s", verify_rows_list[idx].isbn13)
 
-    logger.info("verify: checked=%s failed=%s", verify_count, failures)
+    logger.info("verify: checked=%s urls=%s failed=%s", verify_count, len(groups), failures)
     results = [r for r in verified if r is not None]
     if verify_count < len(rows):
         results.extend(rows[verify_count:])
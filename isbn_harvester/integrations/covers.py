@@ -1,28 +1,44 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
+import itertools
 import logging
+import string
 import sys
 import threading
 import time
 from dataclasses import replace
 from datetime import datetime, timezone
-from queue import Queue, Empty
-from typing import Dict, Optional, Tuple
-from urllib.parse import urlparse, quote
+from functools import partial
+from operator import attrgetter
+from queue import Queue
+from typing import Callable, Dict, Optional, Set, Tuple
+from urllib.parse import quote
 
 import requests
 
 from isbn_harvester.core.checkpoint import CheckpointWriter, read_completed_covers
 from isbn_harvester.core.models import BookRow
 from isbn_harvester.core.store import RowStore
-from isbn_harvester.integrations.http_client import ISBNDB_BASE_URL, TokenBucket, isbndb_get, clone_isbndb_session
+from isbn_harvester.integrations.http_client import (
+    ISBNDB_BASE_URL,
+    TokenBucket,
+    clone_isbndb_session,
+    isbndb_get,
+    make_pooled_adapter,
+    make_pooled_session,
+)
 
 logger = logging.getLogger(__name__)
 try:
     import boto3
+    from botocore.config import Config as BotoConfig
 except Exception:
     boto3 = None
+    BotoConfig = None
+
+_MISSING = object()
 
 
 def isbndb_fetch_book_detail(session: requests.Session, isbn13: str, *, timeout_s: int, retries: int) -> Optional[dict]:
@@ -41,15 +57,39 @@ def extract_isbndb_cover_urls(book: Optional[dict]) -> Tuple[Optional[str], Opti
     return cover, cover_orig
 
 
+_COVER_EXTS = frozenset(("jpeg", "jpg", "png", "webp", "gif"))
+_URL_SCHEME_CHARS = frozenset(string.ascii_letters + string.digits + "+-.")
+
+
 def guess_ext_from_url(url: str) -> str:
-    parsed = urlparse(url)
-    if "." in parsed.path:
-        ext = parsed.path.rsplit(".", 1)[-1].lower()
-        if ext in ("jpeg", "jpg", "png", "webp", "gif"):
+    # Plain string slicing instead of urlparse: only the last path segment matters.
+    path = url.partition("#")[0].partition("?")[0]
+    scheme, sep, rest = path.partition(":")
+    if sep and scheme[:1].isalpha() and _URL_SCHEME_CHARS.issuperset(scheme):
+        path = rest
+    if path.startswith("//"):
+        path = path[2:].partition("/")[2]
+    _, dot, ext = path.rpartition("/")[2].partition(";")[0].rpartition(".")
+    if dot:
+        ext = ext.lower()
+        if ext in _COVER_EXTS:
             return ext
     return "jpg"
 
 
+def _read_capped(r: requests.Response, max_bytes: int, chunk_size: int = 64 * 1024) -> bytes:
+    # Stream the body and stop as soon as it passes max_bytes, rather than buffering an
+    # oversized image (or one without Content-Length) in full before rejecting it.
+    chunks = []
+    total = 0
+    for chunk in r.iter_content(chunk_size):
+        total += len(chunk)
+        if total > max_bytes:
+            raise RuntimeError(f"Image too large (>{max_bytes} bytes)")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 def fetch_image_bytes(
     session: requests.Session,
     url: str,
@@ -62,25 +102,23 @@ def fetch_image_bytes(
     for attempt in range(1, retries + 2):
         try:
             logger.debug("GET image %s attempt=%s/%s", url, attempt, retries + 1)
-            r = session.get(url, timeout=timeout_s, stream=True)
-            content_len = r.headers.get("Content-Length")
-            if content_len and content_len.isdigit():
-                if int(content_len) > max_bytes:
-                    raise RuntimeError(f"Image too large ({content_len} bytes)")
-            if r.status_code in (429, 500, 502, 503, 504):
-                if attempt <= retries:
-                    time.sleep(min(30.0, backoff))
-                    backoff = min(30.0, backoff * 2)
-                    continue
-
-            r.raise_for_status()
-            content_type = (r.headers.get("Content-Type") or "image/jpeg").split(";")[0].strip().lower()
-            body = r.content or b""
-
-            if not content_type.startswith("image/"):
-                raise RuntimeError(f"Non-image content-type: {content_type}")
-            if len(body) > max_bytes:
-                raise RuntimeError(f"Image too large ({len(body)} bytes)")
+            with session.get(url, timeout=timeout_s, stream=True) as r:
+                content_len = r.headers.get("Content-Length")
+                if content_len and content_len.isdigit():
+                    if int(content_len) > max_bytes:
+                        raise RuntimeError(f"Image too large ({content_len} bytes)")
+                if r.status_code in (429, 500, 502, 503, 504):
+                    if attempt <= retries:
+                        time.sleep(min(30.0, backoff))
+                        backoff = min(30.0, backoff * 2)
+                        continue
+
+                r.raise_for_status()
+                content_type = (r.headers.get("Content-Type") or "image/jpeg").split(";")[0].strip().lower()
+                if not content_type.startswith("image/"):
+                    raise RuntimeError(f"Non-image content-type: {content_type}")
+                body = _read_capped(r, max_bytes)
+
             if len(body) < 2048:
                 raise RuntimeError(f"Image too small ({len(body)} bytes)")
 
@@ -108,6 +146,44 @@ def s3_find_existing_cover_key(s3, bucket: str, isbn13: str) -> Optional[str]:
     return None
 
 
+def s3_list_cover_keys(
+    s3,
+    bucket: str,
+    isbn13s: Set[str],
+    max_pages: int = 0,
+) -> Dict[str, Optional[str]]:
+    """
+    One paginated listing of covers/ instead of a list_objects_v2 call per ISBN.
+    Maps each settled ISBN to its first key (same one a per-ISBN MaxKeys=1 listing
+    returns) or None.
+
+    Keys come back in lexicographic order, so the listing starts at the smallest
+    requested ISBN and stops once it passes the largest. With max_pages > 0 it also
+    stops after that many pages; only ISBNs the listing has fully passed are then
+    returned, and the caller looks up the rest one by one.
+    """
+    if not isbn13s:
+        return {}
+    found: Dict[str, Optional[str]] = dict.fromkeys(isbn13s)
+    first, last = min(isbn13s), max(isbn13s)
+    paginator = s3.get_paginator("list_objects_v2")
+    # "covers/<first>" sorts just before every "covers/<first>/..." key.
+    pages = paginator.paginate(Bucket=bucket, Prefix="covers/", StartAfter=f"covers/{first}")
+    listed = ""
+    for n_pages, page in enumerate(pages, 1):
+        for obj in page.get("Contents") or []:
+            key = obj.get("Key") or ""
+            listed = key[len("covers/"):].partition("/")[0]
+            if listed in found and found[listed] is None:
+                found[listed] = key
+        if listed > last:
+            return found
+        if max_pages and n_pages >= max_pages:
+            # The last listed ISBN may have more keys on the next page; it isn't settled.
+            return {isbn13: key for isbn13, key in found.items() if isbn13 < listed}
+    return found
+
+
 def upload_bytes_to_s3(s3, *, bucket: str, key: str, body: bytes, content_type: str) -> None:
     s3.put_object(
         Bucket=bucket,
@@ -118,7 +194,38 @@ def upload_bytes_to_s3(s3, *, bucket: str, key: str, body: bytes, content_type:
     )
 
 
+def _no_cloudfront_url(key: str) -> str:
+    return ""
+
+
+def _with_reused_cover(cur: BookRow, *, key: str, refreshed_at: int, cf_url: str) -> BookRow:
+    return replace(cur, s3_cover_key=key, cover_expires_at=refreshed_at, cloudfront_cover_url=cf_url)
+
+
+def _with_uploaded_cover(
+    cur: BookRow,
+    *,
+    key: str,
+    cover: Optional[str],
+    cover_orig: Optional[str],
+    refreshed_at: int,
+    cf_url: str,
+) -> BookRow:
+    # Rows stay immutable (snapshots share them), so this is a copy, not an in-place update.
+    return replace(
+        cur,
+        s3_cover_key=key,
+        cover_url=cover or cur.cover_url,
+        cover_url_original=cover_orig or cur.cover_url_original,
+        cover_expires_at=refreshed_at,
+        cloudfront_cover_url=cf_url,
+    )
+
+
 class CoverUploader:
+    # Below this many targets the per-ISBN list calls are few enough not to bother.
+    S3_PREFILL_MIN_TARGETS = 50
+
     def __init__(
         self,
         *,
@@ -138,6 +245,8 @@ class CoverUploader:
         checkpoint_path: Optional[str],
         stop_file: Optional[str],
         max_seconds: int,
+        done_covers: Optional[Set[str]] = None,
+        meta_concurrency: int = 2,
     ) -> None:
         self.isbndb_session = isbndb_session
         self.store = store
@@ -148,25 +257,36 @@ class CoverUploader:
         self.timeout_s = timeout_s
         self.retries = retries
         self.cover_concurrency = max(1, cover_concurrency)
+        self.meta_concurrency = max(1, meta_concurrency)
         self.rate_limiter = rate_limiter
         self.s3_bucket = s3_bucket
         self.aws_region = aws_region
         self.cloudfront_domain = cloudfront_domain
+        # Bound once: S3 key -> CloudFront URL, or "" when no domain is configured.
+        self._cf_url: Callable[[str], str] = (
+            partial("https://{}/{}".format, cloudfront_domain) if cloudfront_domain else _no_cloudfront_url
+        )
         self.checkpoint_path = checkpoint_path
         self.stop_file = stop_file
         self.max_seconds = max_seconds
+        self.done_covers = done_covers
 
         if boto3 is None:
             raise SystemExit("boto3 is required for --covers. Install: pip install boto3")
 
-        self.s3 = boto3.client("s3", region_name=aws_region)
+        # botocore's default pool is 10 connections, which would cap uploads below cover_concurrency.
+        s3_config = BotoConfig(
+            max_pool_connections=max(10, self.cover_concurrency * 2),
+            retries={"max_attempts": max(1, retries + 1), "mode": "standard"},
+            tcp_keepalive=True,
+        )
+        self.s3 = boto3.client("s3", region_name=aws_region, config=s3_config)
         self._start_ts = 0.0
 
         self._progress_lock = threading.Lock()
         self._uploaded = 0
         self._errors = 0
         self._s3_cache: Dict[str, Optional[str]] = {}
-        self._s3_cache_lock = threading.Lock()
 
     def should_stop(self) -> bool:
         if self.max_seconds > 0 and (time.time() - self._start_ts) >= self.max_seconds:
@@ -175,36 +295,50 @@ class CoverUploader:
             return True
         return False
 
+    def _prefill_s3_cache(self, targets: list[str]) -> None:
+        if not self.skip_existing_s3 or len(targets) < self.S3_PREFILL_MIN_TARGETS:
+            return
+        try:
+            # One list page per target bounds the prefill at the cost of the per-ISBN
+            # calls it replaces, however large the bucket's covers/ prefix has grown.
+            found = s3_list_cover_keys(self.s3, self.s3_bucket, set(targets), max_pages=len(targets))
+        except Exception as e:
+            logger.warning("S3 cover listing failed; falling back to per-ISBN lookups: %r", e)
+            return
+        self._s3_cache.update(found)
+        logger.info("S3 cover prefill: %s of %s targets already uploaded", sum(1 for k in found.values() if k), len(targets))
+
     def _get_existing_cover_key(self, isbn13: str) -> Optional[str]:
-        with self._s3_cache_lock:
-            if isbn13 in self._s3_cache:
-                return self._s3_cache[isbn13]
-        key = s3_find_existing_cover_key(self.s3, self.s3_bucket, isbn13)
-        with self._s3_cache_lock:
+        # No lock: the cache is only filled before workers start or by single dict stores,
+        # entries are never removed, and each ISBN is queued to exactly one worker.
+        key = self._s3_cache.get(isbn13, _MISSING)
+        if key is _MISSING:
+            key = s3_find_existing_cover_key(self.s3, self.s3_bucket, isbn13)
             self._s3_cache[isbn13] = key
         return key
 
     def run(self) -> int:
-        done_covers = read_completed_covers(self.checkpoint_path)
-
-        rows = self.store.snapshot_values()
-        rows.sort(key=lambda r: r.rank_score, reverse=True)
-
-        targets: list[str] = []
-        for r in rows:
-            if len(targets) >= self.max_covers:
-                break
-            if r.isbn13 in done_covers:
-                continue
-            if self.min_rank is not None and r.rank_score < self.min_rank:
-                continue
-            if r.s3_cover_key and r.cloudfront_cover_url:
-                continue
-            targets.append(r.isbn13)
-
-        q: Queue[str] = Queue()
-        for isbn13 in targets:
-            q.put(isbn13)
+        done_covers = self.done_covers
+        if done_covers is None:
+            done_covers = read_completed_covers(self.checkpoint_path)
+
+        min_rank = self.min_rank
+        candidates = (
+            r
+            for r in self.store.snapshot_values()
+            if r.isbn13 not in done_covers
+            and (min_rank is None or r.rank_score >= min_rank)
+            and not (r.s3_cover_key and r.cloudfront_cover_url)
+        )
+        # Bounded heap instead of sorting the whole store; ties keep snapshot order like a stable sort.
+        targets = [r.isbn13 for r in heapq.nlargest(self.max_covers, candidates, key=attrgetter("rank_score"))]
+
+        self._prefill_s3_cache(targets)
+
+        # targets is fixed up front, so workers claim them through a shared counter;
+        # next() on itertools.count is atomic under the GIL, so no queue lock per cover.
+        next_target = itertools.count()
+        n_targets = len(targets)
 
         ck = CheckpointWriter(self.checkpoint_path)
         refreshed_at = int(datetime.now(timezone.utc).timestamp())
@@ -220,54 +354,118 @@ class CoverUploader:
             with self._progress_lock:
                 self._errors += int(n)
 
-        def progress_snapshot() -> tuple[int, int]:
+        processed = [0]
+        live_workers = [self.cover_concurrency]
+        all_done = threading.Event()
+        stopping = threading.Event()
+
+        def bump_processed() -> None:
             with self._progress_lock:
-                return self._uploaded, self._errors
+                processed[0] += 1
 
-        def cover_worker() -> None:
-            img_sess = requests.Session()
-            isbndb_sess = clone_isbndb_session(self.isbndb_session)
+        def progress_snapshot() -> tuple[int, int, int]:
+            with self._progress_lock:
+                return self._uploaded, self._errors, processed[0]
+
+        # One pooled session shared by all workers: image hosts repeat, so keep-alive
+        # connections (and TLS sessions) get reused across covers.
+        img_sess = make_pooled_session(self.cover_concurrency)
+        # Likewise one connection pool for every metadata worker's ISBNdb session: they all
+        # hit the same host, so a connection opened by one worker is reusable by the others.
+        isbndb_adapter = make_pooled_adapter(self.meta_concurrency)
+
+        # Two stages: cover workers handle reuse/download/upload, and hand rows with no
+        # known cover URL to a separate pool of ISBNdb lookup workers, so a worker never
+        # sits in the rate limiter while images and uploads are waiting.
+        meta_q: Queue[Optional[str]] = Queue()
+        xfer_q: Queue[Optional[Tuple[str, Optional[str], Optional[str]]]] = Queue()
+        feeding_workers = [self.cover_concurrency]
+        live_meta = [self.meta_concurrency]
+
+        def record_error(isbn13: str, e: Exception) -> None:
+            bump_error(1)
+            ck.write({"type": "cover_error", "isbn13": isbn13, "error": repr(e), "ts": time.time()})
+            logger.error("Cover error for %s: %r", isbn13, e)
+
+        def transfer(isbn13: str, cover: Optional[str], cover_orig: Optional[str]) -> None:
+            if not cover and not cover_orig:
+                ck.write({"type": "cover_done", "isbn13": isbn13, "ts": time.time(), "mode": "no_cover"})
+                logger.debug("No cover for %s", isbn13)
+                return
+
+            chosen = (cover_orig if self.prefer_original and cover_orig else cover) or cover_orig
+            if not chosen:
+                ck.write({"type": "cover_done", "isbn13": isbn13, "ts": time.time(), "mode": "no_chosen_url"})
+                logger.debug("No chosen cover URL for %s", isbn13)
+                return
+
+            img_bytes, content_type = fetch_image_bytes(img_sess, chosen, timeout_s=self.timeout_s, retries=self.retries)
+            ext = guess_ext_from_url(chosen)
+            key = s3_key_for_isbn_and_bytes(isbn13, ext, img_bytes)
+
+            upload_bytes_to_s3(self.s3, bucket=self.s3_bucket, key=key, body=img_bytes, content_type=content_type)
+
+            cf_url = self._cf_url(key)
+
+            updated = self.store.update_if_present(
+                isbn13,
+                partial(
+                    _with_uploaded_cover,
+                    key=key,
+                    cover=cover,
+                    cover_orig=cover_orig,
+                    refreshed_at=refreshed_at,
+                    cf_url=cf_url,
+                ),
+            )
+            if updated:
+                bump_uploaded(1)
+
+            ck.write({"type": "cover_done", "isbn13": isbn13, "ts": time.time(), "mode": "uploaded", "s3_key": key})
+            logger.debug("Cover uploaded: %s -> %s", isbn13, key)
+
+        def start_target(isbn13: str) -> bool:
+            """Reuse or transfer the cover; False when it was handed to the metadata stage."""
+            row = self.store.get(isbn13)
+            if not row:
+                return True
+
+            if self.skip_existing_s3:
+                # The row's own s3_cover_key is authoritative; only ask S3 when it's unset.
+                existing_key = row.s3_cover_key or self._get_existing_cover_key(isbn13)
+                if existing_key:
+                    cf_url = self._cf_url(existing_key)
+
+                    updated = self.store.update_if_present(
+                        isbn13, partial(_with_reused_cover, key=existing_key, refreshed_at=refreshed_at, cf_url=cf_url)
+                    )
+                    if updated:
+                        bump_uploaded(1)
 
-            while True:
-                if self.should_stop():
-                    return
-                try:
-                    isbn13 = q.get_nowait()
-                except Empty:
-                    return
+                    ck.write({"type": "cover_done", "isbn13": isbn13, "ts": time.time(), "mode": "reuse_existing_s3", "s3_key": existing_key})
+                    logger.debug("Cover reused from S3: %s -> %s", isbn13, existing_key)
+                    return True
 
-                try:
-                    row = self.store.get(isbn13)
-                    if not row:
-                        q.task_done()
-                        continue
+            cover = row.cover_url or None
+            cover_orig = row.cover_url_original or None
+            if not cover and not cover_orig:
+                meta_q.put(isbn13)
+                return False
+
+            transfer(isbn13, cover, cover_orig)
+            return True
 
-                    if self.skip_existing_s3:
-                        existing_key = self._get_existing_cover_key(isbn13)
-                        if existing_key:
-                            cf_url = f"https://{self.cloudfront_domain}/{existing_key}" if self.cloudfront_domain else ""
-
-                            def _reuse(cur: BookRow) -> BookRow:
-                                return replace(
-                                    cur,
-                                    s3_cover_key=existing_key,
-                                    cover_expires_at=refreshed_at,
-                                    cloudfront_cover_url=cf_url,
-                                )
-
-                            updated = self.store.update_if_present(isbn13, _reuse)
-                            if updated:
-                                bump_uploaded(1)
-
-                            ck.write({"type": "cover_reused_existing_s3", "isbn13": isbn13, "s3_key": existing_key, "ts": time.time()})
-                            ck.write({"type": "cover_done", "isbn13": isbn13, "ts": time.time(), "mode": "reuse_existing_s3"})
-                            logger.debug("Cover reused from S3: %s -> %s", isbn13, existing_key)
-                            q.task_done()
-                            continue
-
-                    cover = row.cover_url or None
-                    cover_orig = row.cover_url_original or None
-                    if not cover and not cover_orig:
+        def meta_worker() -> None:
+            isbndb_sess = clone_isbndb_session(self.isbndb_session, adapter=isbndb_adapter)
+            try:
+                while True:
+                    isbn13 = meta_q.get()
+                    if isbn13 is None:
+                        return
+                    if stopping.is_set():
+                        bump_processed()
+                        continue
+                    try:
                         self.rate_limiter.take(1.0)
                         detail = isbndb_fetch_book_detail(
                             isbndb_sess,
@@ -276,76 +474,94 @@ class CoverUploader:
                             retries=self.retries,
                         )
                         cover, cover_orig = extract_isbndb_cover_urls(detail)
-
-                    if not cover and not cover_orig:
-                        ck.write({"type": "cover_done", "isbn13": isbn13, "ts": time.time(), "mode": "no_cover"})
-                        logger.debug("No cover for %s", isbn13)
-                        q.task_done()
-                        continue
-
-                    chosen = (cover_orig if self.prefer_original and cover_orig else cover) or cover_orig
-                    if not chosen:
-                        ck.write({"type": "cover_done", "isbn13": isbn13, "ts": time.time(), "mode": "no_chosen_url"})
-                        logger.debug("No chosen cover URL for %s", isbn13)
-                        q.task_done()
+                    except Exception as e:
+                        record_error(isbn13, e)
+                        bump_processed()
                         continue
+                    xfer_q.put((isbn13, cover, cover_orig))
+            finally:
+                with self._progress_lock:
+                    live_meta[0] -= 1
+                    last_meta = live_meta[0] <= 0
+                if last_meta:
+                    # Release the cover workers waiting on transfers from this stage.
+                    for _ in range(self.cover_concurrency):
+                        xfer_q.put(None)
+
+        def finish_feeding() -> None:
+            with self._progress_lock:
+                feeding_workers[0] -= 1
+                last_feeder = feeding_workers[0] <= 0
+            if last_feeder:
+                for _ in range(self.meta_concurrency):
+                    meta_q.put(None)
 
-                    img_bytes, content_type = fetch_image_bytes(img_sess, chosen, timeout_s=self.timeout_s, retries=self.retries)
-                    ext = guess_ext_from_url(chosen)
-                    key = s3_key_for_isbn_and_bytes(isbn13, ext, img_bytes)
-
-                    upload_bytes_to_s3(self.s3, bucket=self.s3_bucket, key=key, body=img_bytes, content_type=content_type)
-
-                    cf_url = f"https://{self.cloudfront_domain}/{key}" if self.cloudfront_domain else ""
-
-                    def _apply(cur: BookRow) -> BookRow:
-                        return replace(
-                            cur,
-                            s3_cover_key=key,
-                            cover_url=cover or cur.cover_url,
-                            cover_url_original=cover_orig or cur.cover_url_original,
-                            cover_expires_at=refreshed_at,
-                            cloudfront_cover_url=cf_url,
-                        )
-
-                    updated = self.store.update_if_present(isbn13, _apply)
-                    if updated:
-                        bump_uploaded(1)
-
-                    ck.write({"type": "cover_uploaded", "isbn13": isbn13, "s3_key": key, "ts": time.time()})
-                    ck.write({"type": "cover_done", "isbn13": isbn13, "ts": time.time(), "mode": "uploaded"})
-                    logger.debug("Cover uploaded: %s -> %s", isbn13, key)
-
-                except Exception as e:
-                    bump_error(1)
-                    ck.write({"type": "cover_error", "isbn13": isbn13, "error": repr(e), "ts": time.time()})
-                    logger.error("Cover error for %s: %r", isbn13, e)
-                finally:
-                    q.task_done()
+        def cover_worker() -> None:
+            # Own targets first; once those run out, finish covers resolved by the metadata stage.
+            try:
+                while not stopping.is_set():
+                    i = next(next_target)
+                    if i >= n_targets:
+                        break
+                    isbn13 = targets[i]
+                    try:
+                        finished = start_target(isbn13)
+                    except Exception as e:
+                        record_error(isbn13, e)
+                        finished = True
+                    if finished:
+                        bump_processed()
+            finally:
+                finish_feeding()
 
-        threads = [threading.Thread(target=cover_worker, daemon=True) for _ in range(self.cover_concurrency)]
-        for t in threads:
+            while True:
+                item = xfer_q.get()
+                if item is None:
+                    return
+                isbn13, cover, cover_orig = item
+                if not stopping.is_set():
+                    try:
+                        transfer(isbn13, cover, cover_orig)
+                    except Exception as e:
+                        record_error(isbn13, e)
+                bump_processed()
+
+        def run_worker() -> None:
+            try:
+                cover_worker()
+            finally:
+                with self._progress_lock:
+                    live_workers[0] -= 1
+                    if live_workers[0] <= 0:
+                        all_done.set()
+
+        meta_threads = [threading.Thread(target=meta_worker, daemon=True) for _ in range(self.meta_concurrency)]
+        threads = [threading.Thread(target=run_worker, daemon=True) for _ in range(self.cover_concurrency)]
+        for t in meta_threads + threads:
             t.start()
 
-        last = time.time()
-        while any(t.is_alive() for t in threads):
-            now = time.time()
-            if now - last >= 1.0:
-                done_n, err_n = progress_snapshot()
-                remaining = q.qsize()
-                stop_note = " | STOPPING" if self.should_stop() else ""
-                sys.stdout.write(f"\rCovers {done_n}/{len(targets)} | errors {err_n} | remaining {remaining}{stop_note}")
-                sys.stdout.flush()
-                last = now
+        # Wake once a second to report (or immediately when the last worker exits);
+        # progress comes from the counters, so the queue lock is never touched here.
+        # The stop check (clock + stop-file stat) also runs here, once per tick, and
+        # reaches the workers through `stopping` instead of being redone per cover.
+        while not all_done.wait(timeout=1.0):
             if self.should_stop():
+                stopping.set()
+            done_n, err_n, processed_n = progress_snapshot()
+            remaining = len(targets) - processed_n
+            stop_note = " | STOPPING" if stopping.is_set() else ""
+            sys.stdout.write(f"\rCovers {done_n}/{len(targets)} | errors {err_n} | remaining {remaining}{stop_note}")
+            sys.stdout.flush()
+            if stopping.is_set():
                 break
-            time.sleep(0.1)
 
-        for t in threads:
+        for t in meta_threads + threads:
             t.join(timeout=1.0)
 
         ck.close()
+        img_sess.close()
+        isbndb_adapter.close()
         print()
-        done_n, _ = progress_snapshot()
+        done_n, _, _ = progress_snapshot()
         logger.info("Cover run complete: uploaded=%s", done_n)
         return done_n
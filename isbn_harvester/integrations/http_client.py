@@ -9,6 +9,7 @@ from typing import Dict, Optional, Tuple
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
 
 ISBNDB_BASE_URL = "https://api2.isbndb.com"
 logger = logging.getLogger(__name__)
@@ -46,25 +47,29 @@ class ISBNdbQuotaError(ISBNdbError):
     pass
 
 class TokenBucket:
+    """
+    Leaky-bucket limiter (GCRA): `burst` takes pass immediately, then one per 1/rate seconds.
+    Each take reserves its slot under the lock with a few float ops and sleeps once, outside
+    the lock, until that slot; waiters never re-poll the bucket.
+    """
+
     def __init__(self, rate_per_sec: float, burst: int) -> None:
         self.rate = max(0.01, float(rate_per_sec))
         self.capacity = max(1, int(burst))
-        self.tokens = float(self.capacity)
         self.lock = threading.Lock()
-        self.last = time.monotonic()
+        self._burst_s = self.capacity / self.rate
+        # Theoretical arrival time of the next request; "now" means the bucket is full.
+        self._tat = time.monotonic()
 
     def take(self, n: float = 1.0) -> None:
-        while True:
-            with self.lock:
-                now = time.monotonic()
-                elapsed = now - self.last
-                self.last = now
-                self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-                if self.tokens >= n:
-                    self.tokens -= n
-                    return
-                need = (n - self.tokens) / self.rate
-            time.sleep(min(0.25, max(0.01, need)))
+        cost = n / self.rate
+        with self.lock:
+            now = time.monotonic()
+            tat = self._tat if self._tat > now else now
+            self._tat = tat + cost
+            wait = self._tat - self._burst_s - now
+        if wait > 0:
+            time.sleep(wait)
 
 
 def make_isbndb_session(api_key: str, auth_header: str = "authorization") -> requests.Session:
@@ -84,9 +89,33 @@ def make_isbndb_session(api_key: str, auth_header: str = "authorization") -> req
     return s
 
 
-def clone_isbndb_session(session: requests.Session) -> requests.Session:
+def make_pooled_adapter(pool_size: int) -> HTTPAdapter:
+    """
+    Adapter whose per-host connection pool fits `pool_size` concurrent workers, so
+    keep-alive connections are reused instead of being dropped past urllib3's default of 10.
+    Retries stay with the callers. The underlying PoolManager is thread-safe, so one
+    adapter can be mounted on several sessions to share connections between them.
+    """
+    n = max(10, int(pool_size))
+    return HTTPAdapter(pool_connections=n, pool_maxsize=n, max_retries=0)
+
+
+def _mount(session: requests.Session, adapter: HTTPAdapter) -> None:
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def make_pooled_session(pool_size: int) -> requests.Session:
+    s = requests.Session()
+    _mount(s, make_pooled_adapter(pool_size))
+    return s
+
+
+def clone_isbndb_session(session: requests.Session, adapter: Optional[HTTPAdapter] = None) -> requests.Session:
     cloned = requests.Session()
     cloned.headers.update(session.headers)
+    if adapter is not None:
+        _mount(cloned, adapter)
     return cloned
 
 
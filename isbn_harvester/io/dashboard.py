@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from operator import attrgetter
 from typing import Iterable, List
 
 from isbn_harvester.core.models import BookRow
@@ -22,7 +23,7 @@ def _row_to_dict(r: BookRow) -> dict:
 
 def write_dashboard(rows: Iterable[BookRow], out_path: str, *, max_rows: int = 500) -> None:
     rows = list(rows)
-    rows.sort(key=lambda r: r.rank_score, reverse=True)
+    rows.sort(key=attrgetter("rank_score"), reverse=True)
     payload: List[dict] = [_row_to_dict(r) for r in rows[:max_rows]]
 
     data_json = json.dumps(payload, ensure_ascii=False).replace("</", "<\\/")
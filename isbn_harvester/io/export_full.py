@@ -5,7 +5,7 @@ import json
 import logging
 import time
 from dataclasses import asdict
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
 from isbn_harvester.core.models import BookRow
 from isbn_harvester.io.utils import atomic_write_csv
@@ -134,68 +134,68 @@ def _to_float(val: str) -> float:
         return 0.0
 
 
-def read_full_csv(path: str) -> List[BookRow]:
+def iter_full_csv(path: str) -> Iterator[BookRow]:
     with open(path, "r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
-        rows: List[BookRow] = []
         for rec in reader:
-            rows.append(
-                BookRow(
-                    isbn13=rec.get("isbn13", ""),
-                    isbn10=rec.get("isbn10", ""),
-                    title=rec.get("title", ""),
-                    title_long=rec.get("title_long", ""),
-                    subtitle=rec.get("subtitle", ""),
-                    edition=rec.get("edition", ""),
-                    dimensions=rec.get("dimensions", ""),
-                    authors=rec.get("authors", ""),
-                    date_published=rec.get("date_published", ""),
-                    publisher=rec.get("publisher", ""),
-                    language=rec.get("language", ""),
-                    subjects=rec.get("subjects", ""),
-                    ol_subjects=rec.get("ol_subjects", ""),
-                    loc_subjects=rec.get("loc_subjects", ""),
-                    pages=rec.get("pages", ""),
-                    format=rec.get("format", ""),
-                    synopsis=rec.get("synopsis", ""),
-                    overview=rec.get("overview", ""),
-                    cover_url=rec.get("cover_url", ""),
-                    cover_url_original=rec.get("cover_url_original", ""),
-                    cover_expires_at=_to_int(rec.get("cover_expires_at", "0")),
-                    s3_cover_key=rec.get("s3_cover_key", ""),
-                    cloudfront_cover_url=rec.get("cloudfront_cover_url", ""),
-                    bookshop_url=rec.get("bookshop_url", ""),
-                    bookshop_affiliate_url=rec.get("bookshop_affiliate_url", ""),
-                    jewish_score=_to_int(rec.get("jewish_score", "0")),
-                    fiction_flag=_to_int(rec.get("fiction_flag", "0")),
-                    popularity_proxy=_to_float(rec.get("popularity_proxy", "0")),
-                    rank_score=_to_float(rec.get("rank_score", "0")),
-                    matched_terms=rec.get("matched_terms", ""),
-                    seen_count=_to_int(rec.get("seen_count", "0")),
-                    sources=rec.get("sources", ""),
-                    shopify_tags=rec.get("shopify_tags", ""),
-                    taxonomy_content_type=rec.get("taxonomy_content_type", ""),
-                    taxonomy_primary_genre=rec.get("taxonomy_primary_genre", ""),
-                    taxonomy_jewish_themes=rec.get("taxonomy_jewish_themes", ""),
-                    taxonomy_geography=rec.get("taxonomy_geography", ""),
-                    taxonomy_historical_era=rec.get("taxonomy_historical_era", ""),
-                    taxonomy_religious_orientation=rec.get("taxonomy_religious_orientation", ""),
-                    taxonomy_cultural_tradition=rec.get("taxonomy_cultural_tradition", ""),
-                    taxonomy_language=rec.get("taxonomy_language", ""),
-                    taxonomy_character_focus=rec.get("taxonomy_character_focus", ""),
-                    taxonomy_narrative_style=rec.get("taxonomy_narrative_style", ""),
-                    taxonomy_emotional_tone=rec.get("taxonomy_emotional_tone", ""),
-                    taxonomy_high_level_categories=rec.get("taxonomy_high_level_categories", ""),
-                    taxonomy_confidence=rec.get("taxonomy_confidence", ""),
-                    taxonomy_tags=rec.get("taxonomy_tags", ""),
-                    google_main_category=rec.get("google_main_category", ""),
-                    google_categories=rec.get("google_categories", ""),
-                    google_average_rating=_to_float(rec.get("google_average_rating", "0")),
-                    google_ratings_count=_to_int(rec.get("google_ratings_count", "0")),
-                    task_endpoint=rec.get("task_endpoint", ""),
-                    task_group=rec.get("task_group", ""),
-                    task_query=rec.get("task_query", ""),
-                    page=_to_int(rec.get("page", "0")),
-                )
+            yield BookRow(
+                isbn13=rec.get("isbn13", ""),
+                isbn10=rec.get("isbn10", ""),
+                title=rec.get("title", ""),
+                title_long=rec.get("title_long", ""),
+                subtitle=rec.get("subtitle", ""),
+                edition=rec.get("edition", ""),
+                dimensions=rec.get("dimensions", ""),
+                authors=rec.get("authors", ""),
+                date_published=rec.get("date_published", ""),
+                publisher=rec.get("publisher", ""),
+                language=rec.get("language", ""),
+                subjects=rec.get("subjects", ""),
+                ol_subjects=rec.get("ol_subjects", ""),
+                loc_subjects=rec.get("loc_subjects", ""),
+                pages=rec.get("pages", ""),
+                format=rec.get("format", ""),
+                synopsis=rec.get("synopsis", ""),
+                overview=rec.get("overview", ""),
+                cover_url=rec.get("cover_url", ""),
+                cover_url_original=rec.get("cover_url_original", ""),
+                cover_expires_at=_to_int(rec.get("cover_expires_at", "0")),
+                s3_cover_key=rec.get("s3_cover_key", ""),
+                cloudfront_cover_url=rec.get("cloudfront_cover_url", ""),
+                bookshop_url=rec.get("bookshop_url", ""),
+                bookshop_affiliate_url=rec.get("bookshop_affiliate_url", ""),
+                jewish_score=_to_int(rec.get("jewish_score", "0")),
+                fiction_flag=_to_int(rec.get("fiction_flag", "0")),
+                popularity_proxy=_to_float(rec.get("popularity_proxy", "0")),
+                rank_score=_to_float(rec.get("rank_score", "0")),
+                matched_terms=rec.get("matched_terms", ""),
+                seen_count=_to_int(rec.get("seen_count", "0")),
+                sources=rec.get("sources", ""),
+                shopify_tags=rec.get("shopify_tags", ""),
+                taxonomy_content_type=rec.get("taxonomy_content_type", ""),
+                taxonomy_primary_genre=rec.get("taxonomy_primary_genre", ""),
+                taxonomy_jewish_themes=rec.get("taxonomy_jewish_themes", ""),
+                taxonomy_geography=rec.get("taxonomy_geography", ""),
+                taxonomy_historical_era=rec.get("taxonomy_historical_era", ""),
+                taxonomy_religious_orientation=rec.get("taxonomy_religious_orientation", ""),
+                taxonomy_cultural_tradition=rec.get("taxonomy_cultural_tradition", ""),
+                taxonomy_language=rec.get("taxonomy_language", ""),
+                taxonomy_character_focus=rec.get("taxonomy_character_focus", ""),
+                taxonomy_narrative_style=rec.get("taxonomy_narrative_style", ""),
+                taxonomy_emotional_tone=rec.get("taxonomy_emotional_tone", ""),
+                taxonomy_high_level_categories=rec.get("taxonomy_high_level_categories", ""),
+                taxonomy_confidence=rec.get("taxonomy_confidence", ""),
+                taxonomy_tags=rec.get("taxonomy_tags", ""),
+                google_main_category=rec.get("google_main_category", ""),
+                google_categories=rec.get("google_categories", ""),
+                google_average_rating=_to_float(rec.get("google_average_rating", "0")),
+                google_ratings_count=_to_int(rec.get("google_ratings_count", "0")),
+                task_endpoint=rec.get("task_endpoint", ""),
+                task_group=rec.get("task_group", ""),
+                task_query=rec.get("task_query", ""),
+                page=_to_int(rec.get("page", "0")),
             )
-        return rows
+
+
+def read_full_csv(path: str) -> List[BookRow]:
+    return list(iter_full_csv(path))
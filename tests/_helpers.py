@@ -0,0 +1,61 @@
+from isbn_harvester.core.models import BookRow
+
+
+def make_row(isbn13: str) -> BookRow:
+    return BookRow(
+        isbn10="",
+        isbn13=isbn13,
+        title="Title",
+        title_long="Title",
+        subtitle="",
+        edition="",
+        dimensions="",
+        authors="",
+        date_published="",
+        publisher="",
+        language="",
+        subjects="",
+        ol_subjects="",
+        loc_subjects="",
+        pages="",
+        format="",
+        synopsis="",
+        overview="",
+        cover_url="",
+        cover_url_original="",
+        cover_expires_at=0,
+        s3_cover_key="",
+        cloudfront_cover_url="",
+        bookshop_url="",
+        bookshop_affiliate_url="",
+        jewish_score=0,
+        fiction_flag=0,
+        popularity_proxy=0.0,
+        rank_score=0.0,
+        matched_terms="",
+        seen_count=1,
+        sources="",
+        shopify_tags="",
+        taxonomy_content_type="",
+        taxonomy_primary_genre="",
+        taxonomy_jewish_themes="[]",
+        taxonomy_geography="[]",
+        taxonomy_historical_era="[]",
+        taxonomy_religious_orientation="[]",
+        taxonomy_cultural_tradition="[]",
+        taxonomy_language="[]",
+        taxonomy_character_focus="[]",
+        taxonomy_narrative_style="[]",
+        taxonomy_emotional_tone="[]",
+        taxonomy_high_level_categories="[]",
+        taxonomy_confidence="{}",
+        taxonomy_tags="",
+        google_main_category="",
+        google_categories="",
+        google_average_rating=0.0,
+        google_ratings_count=0,
+        task_endpoint="search",
+        task_query="q",
+        task_group="g",
+        page=1,
+    )
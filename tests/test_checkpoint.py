@@ -0,0 +1,70 @@
+import hashlib
+import json
+
+from isbn_harvester.core.checkpoint import CheckpointWriter, checkpoint_version, read_completed, task_id, task_ids
+from isbn_harvester.core.models import TaskSpec
+
+
+def test_new_checkpoint_writes_v2_header(tmp_path) -> None:
+    path = tmp_path / "ck.ndjson"
+    ck = CheckpointWriter(str(path))
+    ck.close()
+
+    first = json.loads(path.read_text(encoding="utf-8").splitlines()[0])
+    assert first == {"type": "checkpoint_header", "v": 2}
+    assert checkpoint_version(str(path)) == 2
+
+
+def test_legacy_checkpoint_keeps_sha1_task_ids(tmp_path) -> None:
+    spec = TaskSpec(endpoint="search", query="jewish history", group="alpha")
+    legacy_id = hashlib.sha1(b"search|alpha|jewish history").hexdigest()
+    path = tmp_path / "ck.ndjson"
+    path.write_text(json.dumps({"type": "task_done", "task_id": legacy_id}) + "\n", encoding="utf-8")
+
+    ck = CheckpointWriter(str(path))
+    ck.close()
+
+    assert ck.version == 1
+    assert task_id(spec, ck.version) == legacy_id
+    assert task_id(spec) != legacy_id
+    assert read_completed(str(path))[0] == {int(legacy_id, 16)}
+
+
+def test_read_completed_single_pass(tmp_path) -> None:
+    path = tmp_path / "ck.ndjson"
+    lines = [
+        {"type": "checkpoint_header", "v": 2},
+        {"type": "task_done", "task_id": "00000000000000a1"},
+        {"type": "task_incomplete", "task_id": "00000000000000a2"},
+        {"type": "task_done", "task_id": "not-hex"},
+        {"type": "cover_uploaded", "isbn13": "9780000000001"},
+        {"type": "cover_done", "isbn13": "9780000000002"},
+        {"type": "cover_error", "isbn13": "9780000000003"},
+    ]
+    path.write_text("\n".join(json.dumps(x) for x in lines) + "\nnot json\n", encoding="utf-8")
+
+    tasks, covers = read_completed(str(path))
+
+    assert tasks == {0xA1}
+    assert covers == {"9780000000001", "9780000000002"}
+
+
+def test_checkpoint_writer_drains_buffer_on_close(tmp_path) -> None:
+    path = tmp_path / "ck.ndjson"
+    ck = CheckpointWriter(str(path))
+    for i in range(5):
+        ck.write({"type": "task_done", "task_id": f"{i:016x}"})
+    ck.close()
+    ck.write({"type": "task_done", "task_id": "late"})
+
+    tasks, _ = read_completed(str(path))
+    assert tasks == set(range(5))
+
+
+def test_task_ids_matches_task_id() -> None:
+    specs = [
+        TaskSpec(endpoint="publisher", query="Schocken", group="publisher_seed"),
+        TaskSpec(endpoint="search", query="kibbutz", group="intent"),
+    ]
+    for version in (1, 2):
+        assert task_ids(specs, version) == [task_id(s, version) for s in specs]
@@ -0,0 +1,43 @@
+import os
+
+from isbn_harvester.config import _parse_env_file, load_dotenv
+
+
+def test_parse_env_file_respects_quotes_and_comments(monkeypatch, tmp_path) -> None:
+    env = tmp_path / ".env"
+    env.write_text(
+        "# comment line\n"
+        "HT_PLAIN=value # comment\n"
+        "HT_SINGLE='a # b' # comment\n"
+        "HT_DOUBLE=\"it's # here\"\n"
+        "HT_OPEN='unterminated # still value\n"
+        "  HT_PAD  =  plain  \r\n"
+        "HT_PLAIN=second wins? no\n"
+        "not an assignment\n"
+        "export =skipped\n",
+        encoding="utf-8",
+    )
+    for k in ("HT_PLAIN", "HT_SINGLE", "HT_DOUBLE", "HT_OPEN", "HT_PAD", "export"):
+        # setenv first so monkeypatch restores (removes) whatever the parser sets.
+        monkeypatch.setenv(k, "")
+        monkeypatch.delenv(k)
+
+    _parse_env_file(env)
+
+    assert os.environ["HT_PLAIN"] == "value"
+    assert os.environ["HT_SINGLE"] == "a # b"
+    assert os.environ["HT_DOUBLE"] == "it's # here"
+    assert os.environ["HT_OPEN"] == "'unterminated # still value"
+    assert os.environ["HT_PAD"] == "plain"
+    assert "export" not in os.environ
+
+
+def test_load_dotenv_explicit_path(monkeypatch, tmp_path) -> None:
+    env = tmp_path / "custom.env"
+    env.write_text("export HARVESTER_TEST_KEY='abc' # note\n", encoding="utf-8")
+    monkeypatch.delenv("ENV_PATH", raising=False)
+    monkeypatch.setenv("HARVESTER_TEST_KEY", "")
+    monkeypatch.delenv("HARVESTER_TEST_KEY")
+
+    assert load_dotenv(str(env)) == str(env.resolve())
+    assert os.environ["HARVESTER_TEST_KEY"] == "abc"
@@ -0,0 +1,101 @@
+import pytest
+
+from isbn_harvester.integrations.covers import fetch_image_bytes, guess_ext_from_url, s3_list_cover_keys
+
+
+class _FakePaginator:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def paginate(self, **kwargs):
+        assert kwargs["Prefix"] == "covers/"
+        return iter(self.pages)
+
+
+class _FakeS3:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        return _FakePaginator(self.pages)
+
+
+def test_s3_list_cover_keys_buckets_by_isbn() -> None:
+    s3 = _FakeS3(
+        [
+            {"Contents": [{"Key": "covers/9780000000001/aaa.jpg"}, {"Key": "covers/9780000000001/bbb.jpg"}]},
+            {"Contents": [{"Key": "covers/9780000000009/ccc.png"}]},
+            {},
+        ]
+    )
+
+    found = s3_list_cover_keys(s3, "bucket", {"9780000000001", "9780000000002"})
+
+    assert found == {"9780000000001": "covers/9780000000001/aaa.jpg", "9780000000002": None}
+
+
+def test_s3_list_cover_keys_page_budget_returns_only_settled_isbns() -> None:
+    s3 = _FakeS3(
+        [
+            {"Contents": [{"Key": "covers/9780000000001/aaa.jpg"}, {"Key": "covers/9780000000003/bbb.jpg"}]},
+            {"Contents": [{"Key": "covers/9780000000003/ccc.jpg"}, {"Key": "covers/9780000000005/ddd.jpg"}]},
+        ]
+    )
+
+    found = s3_list_cover_keys(s3, "bucket", {"9780000000001", "9780000000002", "9780000000003", "9780000000005"}, max_pages=1)
+
+    # 9780000000003 was the last key listed and may continue on the next page.
+    assert found == {"9780000000001": "covers/9780000000001/aaa.jpg", "9780000000002": None}
+
+
+class _FakeImageResponse:
+    status_code = 200
+
+    def __init__(self, chunks, headers=None):
+        self.chunks = chunks
+        self.headers = headers or {"Content-Type": "image/jpeg"}
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+    def raise_for_status(self):
+        return None
+
+    def iter_content(self, chunk_size):
+        yield from self.chunks
+
+
+class _FakeImageSession:
+    def __init__(self, resp):
+        self.resp = resp
+
+    def get(self, url, **kwargs):
+        return self.resp
+
+
+def test_fetch_image_bytes_reads_body_and_closes() -> None:
+    resp = _FakeImageResponse([b"a" * 3000, b"b" * 3000])
+    body, content_type = fetch_image_bytes(_FakeImageSession(resp), "https://x/y.jpg", timeout_s=1, retries=0)
+    assert body == b"a" * 3000 + b"b" * 3000
+    assert content_type == "image/jpeg"
+    assert resp.closed
+
+
+def test_fetch_image_bytes_stops_past_max_bytes() -> None:
+    resp = _FakeImageResponse(iter([b"x" * 4096] * 10))
+    with pytest.raises(RuntimeError, match="too large"):
+        fetch_image_bytes(_FakeImageSession(resp), "https://x/y.jpg", timeout_s=1, retries=0, max_bytes=8192)
+    assert resp.closed
+
+
+def test_guess_ext_from_url_uses_last_path_segment() -> None:
+    assert guess_ext_from_url("https://images.example.com/covers/9781.PNG?w=200#x.gif") == "png"
+    assert guess_ext_from_url("https://cdn.example.png/cover") == "jpg"
+    assert guess_ext_from_url("//cdn.example.com/a.webp;v=2") == "webp"
+    assert guess_ext_from_url("https://cdn.example.com/a.png/") == "jpg"
+    assert guess_ext_from_url("https://cdn.example.com/a.tiff") == "jpg"
@@ -1,69 +1,12 @@
-from isbn_harvester.core.models import BookRow
-from isbn_harvester.enrich import external_enrich as enrich_mod
+import orjson
 
+from isbn_harvester.enrich import external_enrich as enrich_mod
 
-def _make_row(isbn13: str) -> BookRow:
-    return BookRow(
-        isbn10="",
-        isbn13=isbn13,
-        title="Title",
-        title_long="Title",
-        subtitle="",
-        edition="",
-        dimensions="",
-        authors="",
-        date_published="",
-        publisher="",
-        language="",
-        subjects="",
-        ol_subjects="",
-        loc_subjects="",
-        pages="",
-        format="",
-        synopsis="",
-        overview="",
-        cover_url="",
-        cover_url_original="",
-        cover_expires_at=0,
-        s3_cover_key="",
-        cloudfront_cover_url="",
-        bookshop_url="",
-        bookshop_affiliate_url="",
-        jewish_score=0,
-        fiction_flag=0,
-        popularity_proxy=0.0,
-        rank_score=0.0,
-        matched_terms="",
-        seen_count=1,
-        sources="",
-        shopify_tags="",
-        taxonomy_content_type="",
-        taxonomy_primary_genre="",
-        taxonomy_jewish_themes="[]",
-        taxonomy_geography="[]",
-        taxonomy_historical_era="[]",
-        taxonomy_religious_orientation="[]",
-        taxonomy_cultural_tradition="[]",
-        taxonomy_language="[]",
-        taxonomy_character_focus="[]",
-        taxonomy_narrative_style="[]",
-        taxonomy_emotional_tone="[]",
-        taxonomy_high_level_categories="[]",
-        taxonomy_confidence="{}",
-        taxonomy_tags="",
-        google_main_category="",
-        google_categories="",
-        google_average_rating=0.0,
-        google_ratings_count=0,
-        task_endpoint="search",
-        task_query="q",
-        task_group="g",
-        page=1,
-    )
+from _helpers import make_row
 
 
 def test_enrich_cache_stats_hits(monkeypatch, tmp_path) -> None:
-    row = _make_row("9780000000001")
+    row = make_row("9780000000001")
     cache_path = tmp_path / "cache.jsonl"
     cache_path.write_text(
         '{"isbn13":"9780000000001","combined":{},"subjects":[],"desc":""}\n',
@@ -97,3 +40,130 @@ def test_enrich_cache_stats_hits(monkeypatch, tmp_path) -> None:
     assert out[0].isbn13 == "9780000000001"
     assert stats["hits"] == 1
     assert stats["misses"] == 0
+
+
+def test_enrich_cache_created_and_reused(monkeypatch, tmp_path) -> None:
+    row = make_row("9780000000002")
+    cache_path = tmp_path / "nested" / "cache.jsonl"
+    calls = []
+
+    def _openlibrary_batch(isbn13s, session, timeout_s, *, debug=False):
+        calls.append(list(isbn13s))
+        return {i: ({"publisher": "Pub"}, ["Judaism"], "<p>About   the book</p>") for i in isbn13s}
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("prefetched rows should not be fetched one by one")
+
+    monkeypatch.setattr(enrich_mod, "_get_openlibrary_batch", _openlibrary_batch)
+    monkeypatch.setattr(enrich_mod, "_get_openlibrary", _fail)
+
+    def _run(stats):
+        return enrich_mod.enrich_rows(
+            [row],
+            google_api_key=None,
+            enable_google_books=False,
+            enable_loc=False,
+            concurrency=1,
+            rate_per_sec=100.0,
+            burst=1,
+            enrich_all=True,
+            cache_path=str(cache_path),
+            cache_stats=stats,
+        )
+
+    first_stats, second_stats = {}, {}
+    first = _run(first_stats)
+    second = _run(second_stats)
+
+    assert calls == [["9780000000002"]]
+    assert first_stats["writes"] == 1
+    assert second_stats["hits"] == 1
+    assert first == second
+    assert second[0].synopsis == "About the book"
+    assert second[0].publisher == "Pub"
+
+
+def test_fallback_search_after_empty_batch_takes_a_token(monkeypatch) -> None:
+    events = []
+
+    class _RecordingBucket(enrich_mod.TokenBucket):
+        def take(self, n=1.0):
+            events.append("take")
+            super().take(n)
+
+    def _openlibrary_batch(isbn13s, session, timeout_s, *, debug=False):
+        events.append("batch")
+        # An ISBN OpenLibrary doesn't know parses like an empty single lookup.
+        return {i: ({}, [], "") for i in isbn13s}
+
+    def _search(title, authors, session, timeout_s, *, debug=False):
+        events.append("search")
+        return {}, [], ""
+
+    monkeypatch.setattr(enrich_mod, "TokenBucket", _RecordingBucket)
+    monkeypatch.setattr(enrich_mod, "_get_openlibrary_batch", _openlibrary_batch)
+    monkeypatch.setattr(enrich_mod, "_get_openlibrary_search", _search)
+
+    enrich_mod.enrich_rows(
+        [make_row("9780000000003")],
+        google_api_key=None,
+        enable_google_books=False,
+        enable_loc=False,
+        concurrency=1,
+        rate_per_sec=100.0,
+        burst=1,
+        enrich_all=True,
+    )
+
+    assert events == ["take", "batch", "take", "search"]
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.headers = headers or {}
+        self.text = ""
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    @property
+    def content(self):
+        return orjson.dumps(self._payload)
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def get(self, url, params=None, timeout=None):
+        return self.responses.pop(0)
+
+
+def test_retry_after_cools_down_the_host(monkeypatch) -> None:
+    monkeypatch.setattr(enrich_mod, "_HOST_COOLDOWN", {})
+    sleeps = []
+    monkeypatch.setattr(enrich_mod.time, "sleep", sleeps.append)
+    session = _FakeSession([_FakeResponse(429, headers={"Retry-After": "7"}), _FakeResponse(200, {"ok": 1})])
+
+    data = enrich_mod._get_json_with_retries(session, "https://api.example.org/books", {}, 5, retries=2)
+
+    assert data == {"ok": 1}
+    assert "api.example.org" in enrich_mod._HOST_COOLDOWN
+    assert len(sleeps) == 1 and 6.0 < sleeps[0] <= 7.0
+    # Another caller to the same host waits out the remaining cooldown too.
+    enrich_mod._wait_for_host("api.example.org")
+    assert len(sleeps) == 2
+
+
+def test_google_cover_url_is_normalized_at_extraction() -> None:
+    links = {
+        "smallThumbnail": "http://books.google.com/books/content?id=x&printsec=frontcover&img=1&zoom=5",
+        "thumbnail": "http://books.google.com/books/content?id=x&printsec=frontcover&img=1&zoom=1&edge=curl",
+    }
+    assert enrich_mod._google_cover_url(links) == (
+        "https://books.google.com/books/content?id=x&printsec=frontcover&img=1&zoom=1"
+    )
+    assert enrich_mod._google_cover_url(None) == ""
@@ -3,6 +3,7 @@ from isbn_harvester.core.normalize import (
     is_valid_isbn10,
     is_valid_isbn13,
     normalize_isbn,
+    snip_html,
 )
 from isbn_harvester.core.parse import parse_book
 
@@ -19,3 +20,8 @@ def test_parse_book_converts_isbn10() -> None:
     isbn13, isbn10, _ = parse_book(book)
     assert isbn10 == "0306406152"
     assert isbn13 == "9780306406157"
+
+
+def test_snip_html_long_text_strips_unclosed_tag_spanning_the_window() -> None:
+    text = "hello <a " + "w " * 500 + "<b " + "w " * 300 + "> end"
+    assert snip_html(text) == "hello end"
@@ -16,3 +16,9 @@ def test_jewish_relevance_score_negative_terms() -> None:
 def test_fiction_flag() -> None:
     assert fiction_flag("Jewish fiction", "A novel", "Test") == 1
     assert fiction_flag("History", "Nonfiction", "Test") == 0
+
+
+def test_synonyms_are_applied() -> None:
+    _, matched = jewish_relevance_score("Chasidic tales for Shabbos")
+    assert "hasidic" in matched
+    assert "shabbat" in matched
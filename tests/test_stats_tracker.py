@@ -0,0 +1,17 @@
+import threading
+
+from isbn_harvester.core.stats_tracker import StatsTracker
+
+
+def test_reset_subtracts_baseline_without_touching_thread_shards() -> None:
+    stats = StatsTracker(tasks_total=5)
+    worker = threading.Thread(target=lambda: (stats.inc_requests(3), stats.inc_kept(2)))
+    worker.start()
+    worker.join()
+    stats.inc_requests()
+
+    stats.reset(tasks_total=7)
+    stats.inc_errors(4)
+    snap = stats.snapshot()
+
+    assert (snap.tasks_total, snap.requests_made, snap.kept, snap.errors) == (7, 0, 0, 4)
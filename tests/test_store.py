@@ -0,0 +1,18 @@
+from isbn_harvester.core.store import RowStore
+
+
+def test_snapshots_keep_insertion_order_across_shards() -> None:
+    isbns = [str(9780000000000 + i * 7919) for i in range(40)]
+    store = RowStore({isbns[0]: "r0", isbns[1]: "r1"})
+    for i, isbn13 in enumerate(isbns[2:], start=2):
+        store.upsert(isbn13, f"r{i}")
+    # Updating an existing ISBN keeps its original position, as a plain dict would.
+    store.set(isbns[0], "r0-updated")
+    store.update_if_present(isbns[5], lambda cur: cur + "-updated")
+
+    expected = {isbn13: f"r{i}" for i, isbn13 in enumerate(isbns)}
+    expected[isbns[0]] = "r0-updated"
+    expected[isbns[5]] = "r5-updated"
+    assert list(store.snapshot_dict().items()) == list(expected.items())
+    assert store.snapshot_values() == list(expected.values())
+    assert store.size() == len(isbns)
@@ -4,3 +4,14 @@ from isbn_harvester.core.tasks import build_tasks
 def test_build_tasks_default_non_empty() -> None:
     tasks = build_tasks(fiction_only=False)
     assert len(tasks) > 0
+
+
+def test_tasks_file_reparsed_when_changed(tmp_path) -> None:
+    path = tmp_path / "tasks.yaml"
+    path.write_text("base_queries:\n  - alpha one\n", encoding="utf-8")
+    first = build_tasks(fiction_only=False, tasks_file=str(path))
+    assert build_tasks(fiction_only=False, tasks_file=str(path)) == first
+
+    path.write_text("base_queries:\n  - alpha one\n  - alpha two\n", encoding="utf-8")
+    queries = {t.query for t in build_tasks(fiction_only=False, tasks_file=str(path))}
+    assert "alpha two" in queries
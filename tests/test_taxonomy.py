@@ -0,0 +1,60 @@
+from dataclasses import replace
+
+from isbn_harvester.enrich import taxonomy_assign as tax_mod
+from isbn_harvester.enrich.taxonomy_assign import _compile_node, _score_node
+
+from _helpers import make_row
+
+
+def test_score_node_counts_overlapping_keywords_and_skips_bad_regex() -> None:
+    node = {
+        "id": "holocaust",
+        "weight": 1.0,
+        "signals": {"keywords": ["Holocaust", "holocaust fiction"], "phrases": ["the camps"], "regex": ["(unclosed", r"\bghetto\b"]},
+        "negative_signals": {"keywords": ["cookbook"]},
+    }
+    node["_compiled"] = _compile_node(node)
+    doc = {"title": "holocaust fiction", "description": "life in the ghetto and the camps"}
+
+    score, matches = _score_node(node, doc, {"title": 3.0, "description": 1.0})
+
+    assert [(m["field"], m["term"], m["type"]) for m in matches] == [
+        ("title", "Holocaust", "keyword"),
+        ("title", "holocaust fiction", "keyword"),
+        ("description", "the camps", "phrase"),
+        ("description", r"\bghetto\b", "regex"),
+    ]
+    assert score == 3.0 + 3.0 + 2.5 + 4.0
+
+
+def test_score_node_compiles_uncompiled_nodes_once() -> None:
+    node = {"id": "shabbat", "signals": {"keywords": ["Shabbat"]}}
+
+    first, _ = _score_node(node, {"title": "a shabbat story"}, None)
+    compiled = node["_compiled"]
+    second, _ = _score_node(node, {"title": "a shabbat story"}, None)
+
+    assert first == second == 3.0
+    assert node["_compiled"] is compiled
+
+
+def test_apply_taxonomy_workers_keep_order_and_records(monkeypatch, tmp_path) -> None:
+    tax_path = tmp_path / "taxonomy.json"
+    tax_path.write_text(
+        '{"meta": {}, "jewish_themes": [{"id": "shabbat", "label": "Shabbat", "signals": {"phrases": ["shabbat"]}}]}',
+        encoding="utf-8",
+    )
+    rows = [
+        replace(make_row(str(9780000000000 + i)), title="a shabbat story" if i % 2 else "a story")
+        for i in range(12)
+    ]
+    monkeypatch.setattr(tax_mod, "MIN_ROWS_PER_WORKER", 1)
+
+    outputs = {}
+    for workers in (1, 2):
+        debug = tmp_path / f"debug_{workers}.jsonl"
+        out = tax_mod.apply_taxonomy(rows, str(tax_path), debug_path=str(debug), workers=workers)
+        outputs[workers] = (out, debug.read_text(encoding="utf-8"))
+
+    assert outputs[1] == outputs[2]
+    assert [r.taxonomy_jewish_themes for r in outputs[2][0][:2]] == ["[]", '["shabbat"]']
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 from isbn_harvester.core.models import BookRow
 from isbn_harvester.enrich import verify as verify_mod
 
@@ -22,7 +24,7 @@ def _make_row(isbn13: str, rank_score: float) -> BookRow:
         format="",
         synopsis="",
         overview="",
-        cover_url="http://example.com/cover.jpg",
+        cover_url=f"http://example.com/{isbn13}.jpg",
         cover_url_original="",
         cover_expires_at=0,
         s3_cover_key="",
@@ -81,3 +83,21 @@ def test_verify_rows_max_rows_keeps_unverified(monkeypatch) -> None:
 
     assert [r.isbn13 for r in out] == ["9780000000001", "9780000000002", "9780000000003"]
     assert set(calls) == {"9780000000001", "9780000000002"}
+
+
+def test_verify_rows_checks_shared_cover_url_once(monkeypatch) -> None:
+    calls = []
+
+    def fake_check(session, url, timeout_s):
+        calls.append(url)
+        return "dead" not in url
+
+    monkeypatch.setattr(verify_mod, "_check_url", fake_check)
+
+    shared_ok = [replace(_make_row(f"978000000000{i}", float(10 - i)), cover_url="http://cdn/ok.jpg") for i in range(3)]
+    shared_dead = [replace(_make_row(f"978000000001{i}", float(5 - i)), cover_url="http://cdn/dead.jpg") for i in range(2)]
+
+    out = verify_mod.verify_rows(shared_ok + shared_dead, concurrency=2, timeout_s=1)
+
+    assert sorted(calls) == ["http://cdn/dead.jpg", "http://cdn/ok.jpg"]
+    assert [r.cover_url for r in out] == ["http://cdn/ok.jpg"] * 3 + ["", ""]